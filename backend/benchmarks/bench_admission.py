@@ -0,0 +1,194 @@
+"""로그인 입장 제어 벤치마크 - 속도 제한(429)과 bcrypt 우선순위 대기열이 다른 요청을 보호하는지 측정
+
+사용법:
+    cd backend
+    python benchmarks/bench_admission.py --students 100 --attempts 300 --readers 8
+
+PASSWORD_HASH_NICE 를 0 과 기본값으로 바꿔 가며 자식 프로세스에서 각각 실행합니다.
+  stuffing:  한 IP 에서 여러 이메일로 틀린 비밀번호를 --attempts 번 대입 - 429 비율과 429 응답 지연,
+             실제로 bcrypt 까지 간 시도 수
+  classroom: --students 명이 서로 다른 IP 에서 동시에 로그인 (503 이면 Retry-After 뒤 재시도) 하는 동안
+             인증된 --readers 개 클라이언트(요청 사이 --think-ms 대기)의 GET /api/me, /api/mentors 지연시간(평소 대비)과
+             토큰을 함께 보낸 재로그인(우선순위)의 지연시간
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from common import PASSWORD, import_main, make_parser, summary
+
+
+async def run(args):
+    import httpx
+
+    main, _ = import_main("mentor-admission-", BCRYPT_ROUNDS=args.bcrypt_rounds, PASSWORD_HASH_NICE=args.nice)
+
+    rng = random.Random(args.seed)
+    app = main.app
+    await main.run_migrations()
+    await app.router.startup()
+    async with main.SessionLocal() as db:
+        await main.reset_and_seed(db, 1, args.seed)
+
+    def client_for(ip):
+        transport = httpx.ASGITransport(app=app, client=(ip, 40000))
+        return httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None)
+
+    mentee_emails = [f"mentee{number}@synthetic.example.com" for number in range(1, main.SYNTHETIC_MENTEES_PER_SCALE + 1)]
+    report = {"nice": args.nice, "bcrypt_rounds": main.BCRYPT_ROUNDS, "hash_workers": main.password_hasher.workers}
+
+    # 1) 한 IP 에서의 대입 공격
+    def admitted_hash_jobs():
+        return sum(value for labels, value in main.password_hash_admissions._values.items() if labels[2] == "admitted")
+
+    verify_before = admitted_hash_jobs()
+    statuses, throttled_ms = {}, []
+    async with client_for("203.0.113.7") as attacker:
+        queue = list(range(args.attempts))
+
+        async def attack():
+            while queue:
+                queue.pop()
+                started = time.perf_counter()
+                response = await attacker.post(
+                    "/api/login", json={"email": rng.choice(mentee_emails), "password": f"guess{rng.random()}"}
+                )
+                if response.status_code == 429:
+                    throttled_ms.append((time.perf_counter() - started) * 1000)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        await asyncio.gather(*(attack() for _ in range(args.attack_concurrency)))
+    verified = admitted_hash_jobs() - verify_before
+    report["stuffing"] = {
+        "attempts": args.attempts,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "bcrypt_runs": verified,
+        "throttled": summary(throttled_ms),
+    }
+
+    # 2) 수업 시작 직후 동시 로그인
+    async with main.SessionLocal() as db:
+        readers = (await db.execute(
+            main.select(main.User.id, main.User.email).where(main.User.role == main.UserRole.MENTEE).limit(args.readers)
+        )).all()
+    reader_tokens = [
+        main.create_access_token({"user_id": reader.id, "email": reader.email, "name": "", "role": "mentee"})
+        for reader in readers
+    ]
+
+    async def read_loop(client, headers, latencies, stop):
+        while not stop.is_set():
+            path = "/api/me" if rng.random() < 0.5 else "/api/mentors"
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers, params={"limit": 20} if path != "/api/me" else None)
+            assert response.status_code == 200, response.text
+            latencies.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(args.think_ms / 1000)
+
+    async def read_for(seconds):
+        latencies, stop = [], asyncio.Event()
+        async with client_for("198.51.100.1") as client:
+            tasks = [
+                asyncio.create_task(read_loop(client, {"Authorization": f"Bearer {token}"}, latencies, stop))
+                for token in reader_tokens
+            ]
+            await asyncio.sleep(seconds)
+            stop.set()
+            await asyncio.gather(*tasks)
+        return latencies
+
+    quiet = await read_for(args.quiet_seconds)
+
+    student_ms, priority_ms, retries = [], [], {"student": 0, "priority": 0}
+
+    async def login_until_done(client, kind, email, headers=None):
+        """503 이면 Retry-After 만큼 기다렸다 재시도하는 클라이언트 - 재시도를 포함한 전체 시간(ms) 반환"""
+        started = time.perf_counter()
+        while True:
+            response = await client.post("/api/login", json={"email": email, "password": PASSWORD}, headers=headers)
+            if response.status_code != 503:
+                break
+            retries[kind] += 1
+            await asyncio.sleep(float(response.headers.get("Retry-After", "1")))
+        assert response.status_code == 200, response.text
+        return (time.perf_counter() - started) * 1000
+
+    async def student(number):
+        async with client_for(f"10.{number // 250}.{number % 250}.{rng.randrange(1, 250)}") as client:
+            student_ms.append(await login_until_done(client, "student", mentee_emails[number]))
+
+    async def authenticated_relogin(number):
+        # 이미 로그인한 사용자가 토큰을 든 채 다시 로그인 (우선순위 대기열)
+        await asyncio.sleep(0.2 + number * 0.1)
+        reader = number % len(readers)
+        async with client_for("192.0.2.10") as client:
+            priority_ms.append(await login_until_done(
+                client, "priority", readers[reader].email, {"Authorization": f"Bearer {reader_tokens[reader]}"}
+            ))
+
+    storm_started = time.perf_counter()
+    storm = asyncio.gather(
+        *(student(number) for number in range(args.students)),
+        *(authenticated_relogin(number) for number in range(args.priority_logins)),
+    )
+    busy = []
+    stop = asyncio.Event()
+    async with client_for("198.51.100.1") as client:
+        reader_tasks = [
+            asyncio.create_task(read_loop(client, {"Authorization": f"Bearer {token}"}, busy, stop))
+            for token in reader_tokens
+        ]
+        await storm
+        stop.set()
+        await asyncio.gather(*reader_tasks)
+    report["classroom"] = {
+        "students": args.students,
+        "storm_s": round(time.perf_counter() - storm_started, 2),
+        "busy_retries": retries,
+        "student_login": summary(student_ms),
+        "priority_login": summary(priority_ms),
+        "reads_quiet": summary(quiet),
+        "reads_during_storm": summary(busy),
+    }
+
+    await app.router.shutdown()
+    print(json.dumps(report))
+
+
+def main():
+    parser = make_parser(__doc__, seed=42)
+    parser.add_argument("--students", type=int, default=100, help="동시에 로그인하는 학생 수")
+    parser.add_argument("--attempts", type=int, default=300, help="대입 공격 시도 수")
+    parser.add_argument("--attack-concurrency", type=int, default=20, help="대입 공격 동시 연결 수")
+    parser.add_argument("--readers", type=int, default=8, help="인증된 읽기 클라이언트 수")
+    parser.add_argument("--think-ms", type=float, default=20, help="읽기 클라이언트의 요청 사이 대기 시간(ms)")
+    parser.add_argument("--priority-logins", type=int, default=10, help="토큰을 든 재로그인 수")
+    parser.add_argument("--quiet-seconds", type=float, default=3, help="평소 읽기 지연시간 측정 시간(초)")
+    parser.add_argument("--bcrypt-rounds", type=int, default=10, help="BCRYPT_ROUNDS")
+    parser.add_argument("--nice", type=int, nargs="+", default=[0, 10], help="비교할 PASSWORD_HASH_NICE 값")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        args.nice = args.nice[0]
+        asyncio.run(run(args))
+        return
+
+    results = []
+    for nice in args.nice:
+        command = [sys.executable, os.path.abspath(__file__), "--worker", "--nice", str(nice)]
+        for name in ("students", "attempts", "attack_concurrency", "readers", "think_ms", "priority_logins",
+                     "quiet_seconds", "bcrypt_rounds", "seed"):
+            command += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    print(json.dumps({"cpu_count": os.cpu_count(), "runs": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""동시성 벤치마크 - 느린 DB 쿼리가 도는 동안 가벼운 /api/me 의 지연시간(p50/p95/p99) 을 데이터 계층 방식별로 비교
+
+사용법:
+    cd backend
+    python benchmarks/bench_concurrency.py --clients 50 --requests 20 --db-latency-ms 20
+
+--heavy-every 번째 클라이언트마다 느린 쿼리 라우트를, 나머지는 /api/me 를 --requests 번씩 동시에 호출합니다.
+느린 쿼리는 SQLite 사용자 함수 bench_sleep(ms) 로 --db-latency-ms 만큼의 DB I/O 대기를 흉내 내며
+  async: 앱의 AsyncSession 으로 실행 (현재 데이터 계층, 대기는 aiosqlite 스레드에서)
+  sync:  동기 SQLAlchemy 세션으로 async def 핸들러 안에서 실행 (비동기 전환 전 방식, 대기 동안 이벤트 루프가 멈춤)
+두 방식을 같은 프로세스와 DB 에서 차례로 측정하므로 /api/me 의 p99 차이가 곧 이벤트 루프가 막힌 시간입니다.
+"""
+import asyncio
+import json
+import os
+import time
+
+from common import import_main, login_headers, make_parser, running_app, summary
+
+MODES = ["async", "sync"]
+
+
+def bench_sleep(ms):
+    time.sleep(ms / 1000)
+    return ms
+
+
+def add_slow_query_routes(main, workdir):
+    """두 방식의 느린 쿼리 라우트(/bench/slow-query/{mode})를 앱에 추가"""
+    from fastapi import Depends
+    from sqlalchemy import create_engine, event, text
+    from sqlalchemy.orm import sessionmaker
+
+    slow_query = text("SELECT bench_sleep(:ms)")
+
+    @event.listens_for(main.engine.sync_engine, "connect")
+    def register_async(dbapi_connection, connection_record):
+        dbapi_connection.create_function("bench_sleep", 1, bench_sleep)
+
+    sync_engine = create_engine(f"sqlite:///{os.path.join(workdir, 'mentor_mentee.db')}")
+
+    @event.listens_for(sync_engine, "connect")
+    def register_sync(dbapi_connection, connection_record):
+        dbapi_connection.create_function("bench_sleep", 1, bench_sleep)
+
+    SyncSession = sessionmaker(bind=sync_engine)
+
+    async def async_route(ms: float, db=Depends(main.get_db)):
+        await db.execute(slow_query, {"ms": ms})
+        return {"ms": ms}
+
+    async def sync_route(ms: float):
+        with SyncSession() as db:
+            db.execute(slow_query, {"ms": ms})
+        return {"ms": ms}
+
+    main.app.add_api_route("/bench/slow-query/async", async_route, methods=["GET"])
+    main.app.add_api_route("/bench/slow-query/sync", sync_route, methods=["GET"])
+    return sync_engine
+
+
+async def measure(client, args, mode, headers):
+    latencies = {"/api/me": [], "slow-query": []}
+
+    async def worker(index):
+        slow = index % args.heavy_every == 0
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            if slow:
+                response = await client.get(f"/bench/slow-query/{mode}", params={"ms": args.db_latency_ms})
+            else:
+                response = await client.get("/api/me", headers=headers)
+            latencies["slow-query" if slow else "/api/me"].append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(args.clients)))
+    return {
+        "elapsed_s": round(time.perf_counter() - started, 3),
+        **{name: summary(values) for name, values in latencies.items()},
+    }
+
+
+async def run(args):
+    main, workdir = import_main()
+    sync_engine = add_slow_query_routes(main, workdir)
+    async with running_app(main) as client:
+        headers = await login_headers(client, "mentee@example.com")
+        results = {mode: await measure(client, args, mode, headers) for mode in args.modes}
+    sync_engine.dispose()
+
+    report = {
+        "clients": args.clients,
+        "slow_clients": len(range(0, args.clients, args.heavy_every)),
+        "requests": args.requests,
+        "db_latency_ms": args.db_latency_ms,
+        "modes": results,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--clients", type=int, default=50, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=20, help="클라이언트당 요청 수")
+    parser.add_argument("--heavy-every", type=int, default=5, help="N번째 클라이언트마다 느린 쿼리 호출")
+    parser.add_argument("--db-latency-ms", type=float, default=20, help="느린 쿼리 하나의 DB 대기 시간(ms)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="비교할 데이터 계층 방식")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
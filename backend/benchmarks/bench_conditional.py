@@ -0,0 +1,79 @@
+"""목록 조건부 GET/압축 벤치마크 - 폴링 요청이 304 로 끝날 때와 전체 본문(무압축/gzip/br)을 받을 때 비교
+
+사용법:
+    cd backend
+    python benchmarks/bench_conditional.py --scale 1 --rounds 50
+
+합성 데이터(scale x 멘토 1,000명)를 만든 뒤 프론트엔드가 폴링하는 목록마다 --rounds 번씩
+  identity: If-None-Match 없이 무압축으로 전체 본문
+  gzip/br:  If-None-Match 없이 Accept-Encoding 으로 압축된 본문 (br 은 brotli 가 설치된 경우만)
+  304:      직전 응답의 ETag 로 재검증
+을 요청해 p50/p95 지연시간과 전송 바이트(Content-Length)를 출력합니다.
+"""
+import asyncio
+import json
+import time
+
+from common import import_main, login_headers, make_parser, running_app, summary
+
+
+async def measure(client, path, params, headers, rounds, expected_status):
+    latencies, sizes = [], []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        response = await client.get(path, params=params, headers=headers)
+        latencies.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == expected_status, (path, response.status_code, response.text[:200])
+        sizes.append(int(response.headers.get("content-length", len(response.content))))
+    return {**summary(latencies, digits=3), "bytes": sizes[-1]}
+
+
+async def run(args):
+    main, _ = import_main(BCRYPT_ROUNDS=4)
+    encodings = ["identity", "gzip"] + (["br"] if main.brotli_module() is not None else [])
+    report = {"scale": args.scale, "rounds": args.rounds, "routes": {}}
+    async with running_app(main, reset=False) as client:
+        async with main.SessionLocal() as db:
+            await main.reset_and_seed(db, args.scale, args.seed)
+            # 받은 요청이 가장 많은 멘토
+            busiest_mentor = (await db.execute(
+                main.select(main.User.email)
+                .join(main.MatchRequest, main.MatchRequest.mentor_id == main.User.id)
+                .group_by(main.User.id)
+                .order_by(main.func.count().desc())
+                .limit(1)
+            )).scalar()
+
+        mentee = await login_headers(client, "mentee1@synthetic.example.com")
+        mentor = await login_headers(client, busiest_mentor)
+        routes = [
+            ("/api/mentors", {}, mentee),
+            ("/api/mentors", {"limit": 20}, mentee),
+            ("/api/match-requests/outgoing", {"expand": "counterpart"}, mentee),
+            ("/api/match-requests/incoming", {"expand": "counterpart"}, mentor),
+        ]
+        for path, params, auth in routes:
+            result = {}
+            for encoding in encodings:
+                result[encoding] = await measure(
+                    client, path, params, {**auth, "Accept-Encoding": encoding}, args.rounds, 200
+                )
+            etag = (await client.get(path, params=params, headers=auth)).headers["etag"]
+            result["304"] = await measure(
+                client, path, params, {**auth, "Accept-Encoding": "gzip", "If-None-Match": etag}, args.rounds, 304
+            )
+            label = path + ("?" + "&".join(f"{key}={value}" for key, value in params.items()) if params else "")
+            report["routes"][label] = result
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+def main():
+    parser = make_parser(__doc__, seed=42)
+    parser.add_argument("--scale", type=int, default=1, help="합성 데이터 scale (멘토 수 = scale x 1,000)")
+    parser.add_argument("--rounds", type=int, default=50, help="경우별 요청 수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
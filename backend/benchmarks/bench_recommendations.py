@@ -0,0 +1,186 @@
+"""멘토 추천 벤치마크 - 10만 멘토 규모에서 top-k 조회/증분 갱신 지연시간 측정
+
+사용법:
+    cd backend
+    python benchmarks/bench_recommendations.py --scale 100 --queries 500 --updates 200
+
+reset_and_seed 로 scale x 1,000명의 멘토를 만든 뒤
+  load:      행렬 구성 (백그라운드 태스크, DB 는 나눠 읽고 배열은 스레드에서 구성) 시간과 그동안 이벤트 루프가 가장 오래 멈춘 시간
+  recommend: MentorRecommender.recommend() 만 (행렬 점수 계산 + top-k)
+  fallback:  행렬이 준비되기 전의 SQL 계산 (recommend_mentors_sql)
+  http:      GET /api/mentors/recommended 전체 (인증, 사용자 조회, 직렬화 포함)
+  update:    PUT /api/profile 로 스킬을 바꿨을 때의 행렬 증분 갱신 (update_mentor)
+를 측정하고, 일부 질의는 순수 파이썬으로 다시 계산한 순위 및 SQL 계산 결과와 같은지 확인합니다.
+"""
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+
+from common import auth_headers, import_main, make_parser, running_app, summary
+
+
+def brute_force(main, mentor_skills, matched, interests, limit):
+    """행렬 없이 멘토마다 점수를 계산한 기준 순위"""
+    interests = {skill.lower() for skill in interests}
+    frequency = {}
+    for skills in mentor_skills.values():
+        for skill in skills:
+            frequency[skill] = frequency.get(skill, 0) + 1
+    scored = []
+    for mentor_id, skills in mentor_skills.items():
+        overlap = sum(
+            math.log((1 + len(mentor_skills)) / (1 + frequency[skill])) + 1 for skill in skills if skill in interests
+        )
+        if overlap <= 0:
+            continue
+        score = overlap / math.sqrt(max(len(skills), 1))
+        if mentor_id in matched:
+            score *= main.RECOMMENDATION_MATCHED_WEIGHT
+        scored.append((mentor_id, score))
+    scored.sort(key=lambda item: (-item[1], item[0]))
+    return scored[:limit]
+
+
+async def measure_loop_stall(awaitable):
+    """awaitable 을 기다리는 동안 이벤트 루프가 가장 오래 멈춘 시간(ms) - 1ms 간격 타이머의 최대 지연"""
+    stalls = [0.0]
+    done = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            stalls.append((now - last) * 1000 - 1)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    try:
+        await awaitable
+    finally:
+        done.set()
+        await task
+    return max(stalls)
+
+
+async def run(args):
+    from sqlalchemy import select
+
+    main, _ = import_main()
+    rng = random.Random(args.seed)
+    async with running_app(main, reset=False) as client:
+        async with main.SessionLocal() as db:
+            await main.reset_and_seed(db, args.scale, args.seed)
+        main.mentor_recommender.clear()
+
+        async with main.SessionLocal() as db:
+            mentee_id = (await db.execute(
+                select(main.User.id).where(main.User.role == main.UserRole.MENTEE).limit(1)
+            )).scalar_one()
+            mentor_ids = (await db.execute(
+                select(main.User.id).where(main.User.role == main.UserRole.MENTOR)
+            )).scalars().all()
+            started = time.perf_counter()
+            load_stall_ms = await measure_loop_stall(main.mentor_recommender.ensure_loaded())
+            load_ms = (time.perf_counter() - started) * 1000
+
+        def interests():
+            return rng.sample(main.SYNTHETIC_SKILLS, rng.randint(1, 4))
+
+        recommend_ms = []
+        for _ in range(args.queries):
+            query = interests()
+            started = time.perf_counter()
+            main.mentor_recommender.recommend(query, args.limit)
+            recommend_ms.append((time.perf_counter() - started) * 1000)
+
+        fallback_ms = []
+        async with main.SessionLocal() as db:
+            for _ in range(args.fallback_queries):
+                query = interests()
+                started = time.perf_counter()
+                await main.recommend_mentors_sql(db, query, args.limit)
+                fallback_ms.append((time.perf_counter() - started) * 1000)
+
+        http_ms = []
+        headers = auth_headers(main, mentee_id, "mentee")
+        for _ in range(args.queries):
+            params = {"skills": ",".join(interests()), "limit": args.limit}
+            started = time.perf_counter()
+            response = await client.get("/api/mentors/recommended", params=params, headers=headers)
+            http_ms.append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.text
+
+        update_ms = []
+        for _ in range(args.updates):
+            mentor_id = rng.choice(mentor_ids)
+            skills = interests()
+            started = time.perf_counter()
+            main.mentor_recommender.update_mentor(mentor_id, skills)
+            update_ms.append((time.perf_counter() - started) * 1000)
+            # 실제 경로도 한 번씩 거쳐 DB 와 행렬이 함께 바뀌게 함
+            response = await client.put(
+                "/api/profile",
+                json={"id": mentor_id, "name": "bench", "role": "mentor", "bio": "", "skills": skills},
+                headers=auth_headers(main, mentor_id, "mentor"),
+            )
+            assert response.status_code == 200, response.text
+
+        # 증분 갱신 후의 행렬이 DB 를 처음부터 다시 계산한 결과와 같은지 확인
+        async with main.SessionLocal() as db:
+            rows = (await db.execute(select(main.MentorSkill.user_id, main.MentorSkill.skill_lower))).all()
+            matched = set((await db.execute(
+                select(main.MatchRequest.mentor_id).where(main.MatchRequest.status == main.RequestStatus.ACCEPTED)
+            )).scalars().all())
+        mentor_skills = {}
+        for user_id, skill_lower in rows:
+            mentor_skills.setdefault(user_id, []).append(skill_lower)
+        mismatches = 0
+        async with main.SessionLocal() as db:
+            for _ in range(args.verify):
+                query = interests()
+                expected = brute_force(main, mentor_skills, matched, query, args.limit)
+                for actual in (
+                    main.mentor_recommender.recommend(query, args.limit),
+                    await main.recommend_mentors_sql(db, query, args.limit),
+                ):
+                    if [mentor_id for mentor_id, _ in expected] != [mentor_id for mentor_id, _ in actual] or any(
+                        abs(a[1] - b[1]) > 1e-9 for a, b in zip(expected, actual)
+                    ):
+                        mismatches += 1
+
+    report = {
+        "mentors": len(mentor_ids),
+        "matrix_entries": main.mentor_recommender.entry_count,
+        "skills": len(main.mentor_recommender.skill_columns) - 1,
+        "limit": args.limit,
+        "load_ms": round(load_ms, 1),
+        "load_max_loop_stall_ms": round(load_stall_ms, 1),
+        "recommend": summary(recommend_ms, digits=3),
+        "fallback": summary(fallback_ms, digits=3),
+        "http": summary(http_ms, digits=3),
+        "update": summary(update_ms, digits=3),
+        "verified_queries": args.verify,
+        "mismatches": mismatches,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if mismatches:
+        sys.exit(1)
+
+
+def main():
+    parser = make_parser(__doc__, seed=42)
+    parser.add_argument("--scale", type=int, default=100, help="합성 데이터 scale (멘토 수 = scale x 1,000)")
+    parser.add_argument("--queries", type=int, default=500, help="측정할 추천 질의 수")
+    parser.add_argument("--fallback-queries", type=int, default=50, help="측정할 SQL 대체 경로 질의 수")
+    parser.add_argument("--updates", type=int, default=200, help="측정할 스킬 변경 수")
+    parser.add_argument("--verify", type=int, default=20, help="순수 파이썬 계산과 비교할 질의 수")
+    parser.add_argument("--limit", type=int, default=10, help="top-k 크기")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
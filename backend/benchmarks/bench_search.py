@@ -0,0 +1,67 @@
+"""멘토 전문 검색 벤치마크 - 대량(기본 10만 명) 멘토에서 /api/mentors/search 지연시간 측정
+
+사용법:
+    cd backend
+    python benchmarks/bench_search.py --mentors 100000 --queries 200
+"""
+import asyncio
+import json
+import random
+import time
+
+from common import import_main, login_headers, make_parser, running_app, seed_users, summary
+
+SKILLS = ["React", "Python", "Go", "Rust", "AWS", "Docker", "SQL", "Kotlin", "Swift", "Figma",
+          "TypeScript", "Kubernetes", "TensorFlow", "Flutter", "Django", "Spring", "Vue", "Redis"]
+WORDS = ["백엔드", "프론트엔드", "데이터", "클라우드", "모바일", "디자인", "보안", "게임",
+         "developer", "engineer", "architect", "mentor", "startup", "platform", "infra", "analytics"]
+QUERIES = ["react", "python 데이터", "kube", "클라우드", "swift mobile", "architect", "rust", "figma 디자인"]
+
+
+def search_mentor_fields(rng):
+    """멘토마다 검색어가 섞인 이름/소개와 스킬 4개"""
+    def fields(number):
+        return {
+            "name": f"멘토{number} {rng.choice(WORDS)}",
+            "bio": " ".join(rng.choice(WORDS) for _ in range(12)),
+            "skills": json.dumps(rng.sample(SKILLS, 4), ensure_ascii=False),
+        }
+    return fields
+
+
+async def run(args):
+    main, _ = import_main()
+    async with running_app(main) as client:
+        # 트리거가 FTS 인덱스를 갱신하는 시간까지 포함한 대량 INSERT 시간
+        started = time.perf_counter()
+        await seed_users(main, "search", args.mentors, fields=search_mentor_fields(random.Random(args.seed)))
+        seed_seconds = time.perf_counter() - started
+        headers = await login_headers(client, "mentee@example.com")
+
+        latencies = {}
+        for i in range(args.queries):
+            q = QUERIES[i % len(QUERIES)]
+            started = time.perf_counter()
+            response = await client.get("/api/mentors/search", params={"q": q, "limit": 20}, headers=headers)
+            latencies.setdefault(q, []).append((time.perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.text
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    report = {
+        "mentors": args.mentors,
+        "seed_with_index_s": round(seed_seconds, 2),
+        "overall": summary(all_latencies),
+        "queries": {q: summary(values) for q, values in latencies.items()},
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+def main():
+    parser = make_parser(__doc__, seed=42)
+    parser.add_argument("--mentors", type=int, default=100000, help="생성할 멘토 수")
+    parser.add_argument("--queries", type=int, default=200, help="실행할 검색 요청 수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
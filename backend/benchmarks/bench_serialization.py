@@ -0,0 +1,104 @@
+"""응답 직렬화 마이크로벤치마크 - 멘토 목록 한 번을 만드는 데 드는 CPU 시간 비교
+
+사용법:
+    cd backend
+    python benchmarks/bench_serialization.py --mentors 1000 --rounds 50
+
+  pydantic: 핸들러에서 UserProfile/UserResponse 를 만들고 FastAPI 가 response_model 로
+            다시 검증/직렬화한 뒤 JSONResponse 로 렌더링 (이전 방식)
+  orjson:   serialize_user 로 ORM 행에서 dict 를 바로 만들고 orjson.dumps (현재 방식)
+DB 조회는 제외하고 같은 ORM 객체 목록에서 응답 본문을 만드는 부분만 측정합니다.
+"""
+import asyncio
+import json
+import random
+import time
+from typing import List
+
+from common import import_main, make_parser, mentor_fields
+
+
+def make_mentors(main, count, seed):
+    """DB 없이 메모리에만 만든 멘토 ORM 객체 (절반은 프로필 이미지 있음)"""
+    rng = random.Random(seed)
+    return [
+        main.User(
+            id=number + 1, email=f"mentor{number}@example.com", role=main.UserRole.MENTOR,
+            **mentor_fields(rng, number, skill_count=4, bio="백엔드 개발자입니다. " * 4),
+            profile_image_hash=f"{rng.getrandbits(256):064x}" if number % 2 else None,
+        )
+        for number in range(count)
+    ]
+
+
+async def pydantic_body(main, field, mentors):
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+
+    result = []
+    for mentor in mentors:
+        skills = []
+        if mentor.skills:
+            try:
+                skills = json.loads(mentor.skills)
+            except ValueError:
+                skills = []
+        profile = main.UserProfile(
+            name=mentor.name or "",
+            bio=mentor.bio or "",
+            imageUrl=main.profile_image_url(mentor),
+            skills=skills,
+        )
+        result.append(main.UserResponse(id=mentor.id, email=mentor.email, role=mentor.role, profile=profile))
+    content = await serialize_response(field=field, response_content=result)
+    return JSONResponse(content).body
+
+
+async def orjson_body(main, mentors):
+    import orjson
+
+    return orjson.dumps([main.serialize_user(mentor) for mentor in mentors])
+
+
+async def measure(rounds, build):
+    timings = []
+    for _ in range(rounds):
+        started = time.process_time()
+        body = await build()
+        timings.append((time.process_time() - started) * 1000)
+    timings.sort()
+    return body, {"median_ms": round(timings[len(timings) // 2], 3), "min_ms": round(timings[0], 3)}
+
+
+async def run(args):
+    from fastapi.utils import create_response_field
+
+    main, _ = import_main()
+
+    mentors = make_mentors(main, args.mentors, args.seed)
+    field = create_response_field(name="Response_get_mentors", type_=List[main.UserResponse], mode="serialization")
+
+    old_body, old = await measure(args.rounds, lambda: pydantic_body(main, field, mentors))
+    new_body, new = await measure(args.rounds, lambda: orjson_body(main, mentors))
+    assert json.loads(old_body) == json.loads(new_body), "응답 본문이 다릅니다"
+
+    report = {
+        "mentors": args.mentors,
+        "rounds": args.rounds,
+        "pydantic": old,
+        "orjson": new,
+        "speedup": round(old["median_ms"] / new["median_ms"], 1) if new["median_ms"] else None,
+        "body_bytes": len(new_body),
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+def main():
+    parser = make_parser(__doc__, seed=42)
+    parser.add_argument("--mentors", type=int, default=1000, help="목록에 담을 멘토 수")
+    parser.add_argument("--rounds", type=int, default=50, help="방식별 반복 횟수")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
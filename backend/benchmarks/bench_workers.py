@@ -0,0 +1,207 @@
+"""멀티 워커 벤치마크 - WORKERS 수에 따른 읽기 처리량과 워커 간 캐시 무효화 전파 시간
+
+사용법:
+    cd backend
+    python benchmarks/bench_workers.py --workers 1 2 4 --scale 5 --seconds 10 --client-processes 4
+
+워커 수마다 임시 디렉토리에 DB 를 만들고 (manage.py seed) `python main.py` 를 WORKERS=N 으로 실제 포트에 띄운 뒤,
+--client-processes 개의 클라이언트 프로세스가 읽기 위주 라우트(멘토 목록, 추천, 내 정보)를 동시에 호출합니다.
+이어서 한 멘토의 스킬을 바꾸고, 매번 새 연결(= 임의의 워커)로 조회해 모든 워커가 바뀐 목록을 돌려줄 때까지의
+시간을 잽니다. 서버와 클라이언트가 같은 머신의 코어를 나눠 쓰므로 코어 수가 충분해야 확장성이 드러납니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+from common import BACKEND_DIR, PASSWORD, make_parser, percentile, prepared_workdir
+
+READ_SKILLS = ["React", "Python", "AWS", "Docker", "SQL", "Kotlin", "Go", "TypeScript"]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_client(args):
+    """클라이언트 프로세스: --seconds 동안 --connections 개의 연결로 읽기 요청 반복, 지연시간 목록 출력"""
+    import httpx
+
+    rng = random.Random(args.seed)
+    headers = {"Authorization": f"Bearer {args.token}"}
+    latencies = []
+    errors = 0
+
+    def next_request():
+        pick = rng.random()
+        if pick < 0.5:
+            return "/api/mentors", {"skill": rng.choice(READ_SKILLS), "limit": 20}
+        if pick < 0.8:
+            return "/api/mentors/recommended", {"skills": ",".join(rng.sample(READ_SKILLS, 2))}
+        return "/api/me", {}
+
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, timeout=30) as client:
+        deadline = time.perf_counter() + args.seconds
+
+        async def loop():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                path, params = next_request()
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path, params=params)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(loop() for _ in range(args.connections)))
+    print(json.dumps({"latencies": latencies, "errors": errors}))
+
+
+async def measure_propagation(base_url, mentor_token, mentor_id, mentee_token, rounds, timeout):
+    """멘토 스킬을 바꾼 뒤 새 연결로 rounds 번 연속 새 스킬 목록에 그 멘토가 보일 때까지 걸린 시간(ms)"""
+    import httpx
+
+    skill = f"Propagation{random.randrange(10 ** 9)}"
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        # 갱신 전에 모든 워커가 "없음" 을 캐시해 두도록 먼저 여러 번 조회
+        for _ in range(rounds):
+            await client.get("/api/mentors", params={"skill": skill, "skill_match": "exact"},
+                             headers={"Authorization": f"Bearer {mentee_token}", "Connection": "close"})
+        response = await client.put(
+            "/api/profile",
+            json={"id": mentor_id, "name": "전파 측정", "role": "mentor", "bio": "", "skills": [skill]},
+            headers={"Authorization": f"Bearer {mentor_token}"},
+        )
+        response.raise_for_status()
+        started = time.perf_counter()
+        consecutive = 0
+        while consecutive < rounds:
+            if time.perf_counter() - started > timeout:
+                return None
+            response = await client.get(
+                "/api/mentors", params={"skill": skill, "skill_match": "exact"},
+                headers={"Authorization": f"Bearer {mentee_token}", "Connection": "close"},
+            )
+            found = any(mentor["id"] == mentor_id for mentor in response.json())
+            consecutive = consecutive + 1 if found else 0
+        return round((time.perf_counter() - started) * 1000, 1)
+
+
+async def login(base_url, email):
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        token = (await client.post("/api/login", json={"email": email, "password": PASSWORD})).json()["token"]
+        user = (await client.get("/api/me", headers={"Authorization": f"Bearer {token}"})).json()
+    return token, user["id"]
+
+
+def wait_until_ready(base_url, process, timeout=60):
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            if httpx.get(f"{base_url}/api/admin/cache-stats", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def run_workers(args, workers):
+    workdir = prepared_workdir("mentor-workers-", "seed", "--scale", str(args.scale))
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(BACKEND_DIR, "main.py")],
+        cwd=workdir, env={**os.environ, "WORKERS": str(workers), "PORT": str(port), "HOST": "127.0.0.1"},
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(base_url, server)
+        mentee_token, _ = asyncio.run(login(base_url, "mentee@example.com"))
+        mentor_token, mentor_id = asyncio.run(login(base_url, "mentor1@example.com"))
+
+        clients = [
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "--client", "--base-url", base_url, "--token", mentee_token,
+                 "--seconds", str(args.seconds), "--connections", str(args.connections), "--seed", str(index)],
+                stdout=subprocess.PIPE, text=True,
+            )
+            for index in range(args.client_processes)
+        ]
+        latencies, errors = [], 0
+        for client in clients:
+            output, _ = client.communicate()
+            result = json.loads(output.strip().splitlines()[-1])
+            latencies.extend(result["latencies"])
+            errors += result["errors"]
+
+        propagation = [
+            asyncio.run(measure_propagation(base_url, mentor_token, mentor_id, mentee_token, workers * 4, args.seconds))
+            for _ in range(args.propagation_rounds)
+        ]
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    return {
+        "requests_per_s": round(len(latencies) / args.seconds, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "errors": errors,
+        "propagation_ms": propagation,
+    }
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="비교할 워커 수")
+    parser.add_argument("--scale", type=int, default=5, help="합성 데이터 scale (manage.py seed)")
+    parser.add_argument("--seconds", type=float, default=10, help="부하 시간(초)")
+    parser.add_argument("--client-processes", type=int, default=os.cpu_count() or 1, help="부하 클라이언트 프로세스 수")
+    parser.add_argument("--connections", type=int, default=16, help="클라이언트 프로세스당 동시 연결 수")
+    parser.add_argument("--propagation-rounds", type=int, default=3, help="무효화 전파 측정 횟수")
+    parser.add_argument("--client", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--token", help=argparse.SUPPRESS)
+    parser.add_argument("--seed", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        asyncio.run(run_client(args))
+        return
+
+    results = {workers: run_workers(args, workers) for workers in args.workers}
+    baseline = results[args.workers[0]]["requests_per_s"]
+    report = {
+        "cpu_count": os.cpu_count(),
+        "scale": args.scale,
+        "client_processes": args.client_processes,
+        "connections": args.connections,
+        "workers": {
+            str(workers): {**result, "speedup": round(result["requests_per_s"] / baseline, 2) if baseline else None}
+            for workers, result in results.items()
+        },
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""시작 시간 점검 - `import main` 부터 startup 훅 완료까지의 시간이 예산 안에 드는지 확인
+
+사용법:
+    cd backend
+    python benchmarks/check_startup.py --runs 5 --budget-ms 2000
+    python benchmarks/check_startup.py --profile 25
+
+임시 디렉토리에 마이그레이션된 DB 를 만든 뒤 (manage.py migrate) 매번 새 파이썬 프로세스에서
+import main -> create_app() -> startup 훅 (스키마 버전 확인, 알림 버스 시작) 을 실행하고 단계별 시간을 잽니다.
+준비 완료까지의 중앙값이 --budget-ms 를 넘거나, 첫 요청 전에 쓰지 않는 무거운 모듈(LAZY_MODULES)이
+import 직후 이미 로드되어 있으면 종료 코드 1 로 끝나므로 CI 에서 시작 시간 회귀를 막는 용도로 쓸 수 있습니다.
+--profile N 은 `python -X importtime` 결과에서 누적 시간이 큰 모듈 N 개를 출력합니다.
+"""
+import json
+import subprocess
+import sys
+import time
+
+from common import BACKEND_DIR, make_parser, percentile, prepared_workdir
+
+# 첫 이미지/로그인/추천 요청 때 import 되어야 하는 모듈
+LAZY_MODULES = ["PIL", "numpy", "passlib", "jose"]
+
+CHILD = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, {backend_dir!r})
+import main
+imported = time.perf_counter()
+loaded = [name for name in {lazy_modules!r} if name in sys.modules]
+app = main.create_app()
+created = time.perf_counter()
+
+async def lifecycle():
+    await app.router.startup()
+    ready = time.perf_counter()
+    await app.router.shutdown()
+    await main.engine.dispose()
+    return ready
+
+ready = asyncio.run(lifecycle())
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "startup_ms": (ready - created) * 1000,
+    "ready_ms": (ready - started) * 1000,
+    "lazy_modules_loaded": loaded,
+}}))
+"""
+
+
+def measure(workdir):
+    code = CHILD.format(backend_dir=BACKEND_DIR, lazy_modules=LAZY_MODULES)
+    started = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", code], cwd=workdir, capture_output=True, text=True, check=True).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    # 인터프리터 기동까지 포함한 프로세스 전체 시간
+    result["process_ms"] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def import_profile(workdir, top):
+    """`python -X importtime -c "import main"` 결과를 누적 시간 순으로 정렬해 상위 top 개 반환"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys; sys.path.insert(0, {BACKEND_DIR!r}); import main"],
+        cwd=workdir, capture_output=True, text=True, check=True,
+    ).stderr
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append({"module": name.strip(), "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    entries.sort(key=lambda entry: entry["cumulative_ms"], reverse=True)
+    return entries[:top]
+
+
+def main():
+    parser = make_parser(__doc__)
+    parser.add_argument("--runs", type=int, default=5, help="측정할 새 프로세스 수")
+    parser.add_argument("--budget-ms", type=float, default=2000, help="import 부터 startup 완료까지 중앙값 예산(ms)")
+    parser.add_argument("--profile", type=int, default=0, metavar="N", help="import 시간 상위 N 개 모듈 출력")
+    args = parser.parse_args()
+
+    workdir = prepared_workdir("mentor-startup-", "migrate")
+    measure(workdir)  # 첫 실행은 .pyc 생성과 디스크 캐시 때문에 느리므로 버림
+    runs = [measure(workdir) for _ in range(args.runs)]
+
+    report = {"runs": args.runs, "budget_ms": args.budget_ms}
+    for key in ("import_ms", "create_app_ms", "startup_ms", "ready_ms", "process_ms"):
+        values = [run[key] for run in runs]
+        report[key] = {"p50": round(percentile(values, 50), 1), "p95": round(percentile(values, 95), 1)}
+    loaded = sorted({name for run in runs for name in run["lazy_modules_loaded"]})
+    report["lazy_modules_loaded"] = loaded
+    if args.profile:
+        report["import_profile"] = import_profile(workdir, args.profile)
+
+    failures = []
+    if report["ready_ms"]["p50"] > args.budget_ms:
+        failures.append(f"startup took {report['ready_ms']['p50']} ms (p50), budget is {args.budget_ms} ms")
+    if loaded:
+        failures.append(f"modules that should load lazily were imported at startup: {', '.join(loaded)}")
+    report["ok"] = not failures
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
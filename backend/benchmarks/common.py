@@ -0,0 +1,158 @@
+"""벤치마크 스크립트 공통 도구
+
+각 스크립트는 `python benchmarks/<이름>.py` 로 실행되므로 이 파일은 `import common` 으로 불러옵니다.
+  percentile/summary:  지연시간 목록 요약 (빈 목록이면 0)
+  make_parser:         스크립트 docstring 첫 줄을 설명으로 쓰는 argparse 파서
+  import_main:         임시 디렉토리에서 main 을 import (저장소의 mentor_mentee.db 를 건드리지 않음)
+  running_app:         마이그레이션 + startup 후 프로세스 안 ASGI 클라이언트, 끝나면 shutdown
+  prepared_workdir:    서버를 별도 프로세스로 띄우는 스크립트용, manage.py 를 실행해 둔 임시 디렉토리
+  seed_users:          샘플 멘티의 비밀번호 해시를 재사용해 멘토/멘티 대량 추가 (어느 DB 에서든 동작)
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANAGE_PY = os.path.join(BACKEND_DIR, "manage.py")
+PASSWORD = "password123"  # 샘플 사용자 비밀번호 (해시를 모든 시드 사용자가 공유)
+SAMPLE_MENTEE = "mentee@example.com"
+SKILLS = ["React", "Python", "Go", "Rust", "AWS", "Docker", "SQL", "Kotlin", "Swift", "Figma"]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summary(values, digits=2):
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50), digits),
+        "p95_ms": round(percentile(values, 95), digits),
+        "p99_ms": round(percentile(values, 99), digits),
+    }
+
+
+def make_parser(doc, seed=None):
+    """doc 첫 줄을 설명으로 쓰는 파서 (seed 를 주면 그 값을 기본값으로 --seed 추가)"""
+    parser = argparse.ArgumentParser(description=doc.splitlines()[0])
+    if seed is not None:
+        parser.add_argument("--seed", type=int, default=seed, help="난수 시드")
+    return parser
+
+
+def import_main(prefix="mentor-bench-", **env):
+    """env 를 환경 변수로 설정하고 새 임시 디렉토리로 옮긴 뒤 main 을 import, (main, 작업 디렉토리) 반환
+
+    main 은 import 시점에 설정과 DB 경로(현재 디렉토리의 mentor_mentee.db)를 정하므로 그 전에 호출해야 함
+    """
+    os.environ.update({key: str(value) for key, value in env.items()})
+    workdir = tempfile.mkdtemp(prefix=prefix)
+    os.chdir(workdir)
+    sys.path.insert(0, BACKEND_DIR)
+    import main
+
+    return main, workdir
+
+
+@contextlib.asynccontextmanager
+async def running_app(main, reset=True, base_url="http://bench", **client_options):
+    """마이그레이션과 startup 훅을 실행하고 ASGI 클라이언트를 돌려줌 (reset 이면 샘플 데이터로 초기화)"""
+    import httpx
+
+    await main.run_migrations()
+    await main.app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, **client_options) as client:
+            if reset:
+                response = await client.post("/api/admin/reset-database")
+                assert response.status_code == 200, response.text
+            yield client
+    finally:
+        await main.app.router.shutdown()
+
+
+def prepared_workdir(prefix, *manage_args):
+    """새 임시 디렉토리에서 `manage.py <manage_args>` (migrate, seed 등) 를 실행하고 그 경로 반환"""
+    workdir = tempfile.mkdtemp(prefix=prefix)
+    subprocess.run([sys.executable, MANAGE_PY, *manage_args], cwd=workdir, check=True, capture_output=True)
+    return workdir
+
+
+def auth_headers(main, user_id, role):
+    """로그인(bcrypt) 없이 바로 쓰는 Bearer 헤더"""
+    token = main.create_access_token({"user_id": user_id, "email": "", "name": "", "role": role})
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def login_headers(client, email, password=PASSWORD):
+    response = await client.post("/api/login", json={"email": email, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['token']}"}
+
+
+def user_email(prefix, role, number):
+    return f"{prefix}-{role}{number}@example.com"
+
+
+def mentor_fields(rng, number, skills=SKILLS, skill_count=3, bio="벤치마크용 멘토입니다."):
+    """멘토 number 의 이름/소개/스킬 JSON"""
+    return {
+        "name": f"멘토{number}",
+        "bio": bio,
+        "skills": json.dumps(rng.sample(skills, skill_count), ensure_ascii=False),
+    }
+
+
+async def seed_users(main, prefix, mentors, mentees=0, fields=None, seed=42):
+    """샘플 멘티의 비밀번호 해시를 재사용해 멘토/멘티를 추가하고 (멘토 id 목록, 멘티 id 목록) 을 추가한 순서대로 반환
+
+    fields(number) 는 멘토 number 의 컬럼 dict (기본값: mentor_fields), 멘토 스킬은 mentor_skills 에도 넣음.
+    이메일은 user_email(prefix, "mentor"/"mentee", number).
+    """
+    from sqlalchemy import insert, select
+
+    rng = random.Random(seed)
+    fields = fields or (lambda number: mentor_fields(rng, number))
+    async with main.SessionLocal() as db:
+        hashed_password = (await db.execute(
+            select(main.User.hashed_password).where(main.User.email == SAMPLE_MENTEE)
+        )).scalar_one()
+        mentor_rows = [
+            {
+                "email": user_email(prefix, "mentor", number), "hashed_password": hashed_password,
+                "role": main.UserRole.MENTOR, **fields(number),
+            }
+            for number in range(mentors)
+        ]
+        mentee_rows = [
+            {
+                "email": user_email(prefix, "mentee", number), "hashed_password": hashed_password,
+                "role": main.UserRole.MENTEE, "name": f"멘티{number}", "bio": "",
+            }
+            for number in range(mentees)
+        ]
+        if mentor_rows or mentee_rows:
+            await db.execute(insert(main.User), mentor_rows + mentee_rows)
+        users = (await db.execute(
+            select(main.User.id, main.User.role).where(main.User.email.like(f"{prefix}-%")).order_by(main.User.id)
+        )).all()
+        mentor_ids = [user_id for user_id, role in users if role == main.UserRole.MENTOR]
+        mentee_ids = [user_id for user_id, role in users if role == main.UserRole.MENTEE]
+
+        skill_rows = []
+        for mentor_id, row in zip(mentor_ids, mentor_rows):
+            skill_rows.extend(main.mentor_skill_rows(mentor_id, json.loads(row.get("skills") or "[]")))
+        if skill_rows:
+            await db.execute(insert(main.MentorSkill), skill_rows)
+        await db.commit()
+    return mentor_ids, mentee_ids
@@ -0,0 +1,284 @@
+"""API 부하 테스트 - 시나리오별 엔드포인트 처리량과 p50/p95/p99 를 JSON 으로 보고
+
+사용법:
+    cd backend
+    python benchmarks/load_test.py --mentors 2000 --mentees 2000 --clients 50 --seconds 5 --output before.json
+    # 다른 커밋에서 같은 설정으로 실행해 비교 (p95 가 --threshold 배 이상 느려지면 종료 코드 1)
+    python benchmarks/load_test.py --mentors 2000 --mentees 2000 --compare before.json
+
+임시 디렉토리의 SQLite 파일에 멘토/멘티/매칭 요청/프로필 이미지를 채운 뒤
+실제 ASGI 앱을 프로세스 안에서 구동하고 동시 클라이언트로 시나리오를 차례로 실행합니다.
+  login:    멘티들이 동시에 POST /api/login (bcrypt 풀 포화)
+  mentors:  GET /api/mentors 를 스킬 필터/정렬/페이지 크기를 섞어 조회
+  images:   GET /api/images/mentor/{id} 를 크기/WebP 여부를 섞어 조회
+  contention: 소수의 멘토가 받은 대기 요청을 동시에 수락/거절 (400/404 는 경합에 진 정상 응답)
+"""
+import asyncio
+import io
+import json
+import random
+import subprocess
+import sys
+import time
+
+from common import (
+    BACKEND_DIR, PASSWORD, auth_headers, import_main, make_parser, mentor_fields, percentile, running_app,
+    seed_users, user_email,
+)
+
+SKILLS = [
+    "React", "Python", "Go", "Rust", "AWS", "Docker", "SQL", "Kotlin", "Swift", "Figma",
+    "TypeScript", "Node.js", "Java", "Spring", "Kubernetes", "Flutter", "PyTorch", "DevOps",
+]
+SCENARIOS = ["login", "mentors", "images", "contention"]
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def sample_jpeg(rng):
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    color = tuple(rng.randrange(256) for _ in range(3))
+    Image.new("RGB", (600, 600), color).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+async def seed(main, args, rng):
+    """멘토(스킬 포함)/멘티/대기 중 매칭 요청을 한 번에 추가하고 id 목록 반환"""
+    from sqlalchemy import insert, select
+
+    mentor_ids, mentee_ids = await seed_users(
+        main, "load", args.mentors, args.mentees,
+        fields=lambda number: mentor_fields(rng, number, SKILLS, rng.randint(2, 5), "부하 테스트용 멘토입니다."),
+    )
+    mentees = [(mentee_id, user_email("load", "mentee", number)) for number, mentee_id in enumerate(mentee_ids)]
+
+    async with main.SessionLocal() as db:
+        # 경합 시나리오용: 소수의 "인기" 멘토에게 멘티마다 대기 요청 1개
+        hot_mentors = mentor_ids[:args.contention_mentors]
+        request_rows = [
+            {
+                "mentor_id": rng.choice(hot_mentors), "mentee_id": mentee_id,
+                "message": "부하 테스트 요청", "status": main.RequestStatus.PENDING,
+            }
+            for mentee_id, _ in mentees[:args.requests]
+        ]
+        if request_rows:
+            await db.execute(insert(main.MatchRequest), request_rows)
+        await db.commit()
+        pending = (await db.execute(
+            select(main.MatchRequest.id, main.MatchRequest.mentor_id)
+            .where(main.MatchRequest.status == main.RequestStatus.PENDING)
+        )).all()
+    return mentor_ids, mentees, [(row.id, row.mentor_id) for row in pending]
+
+
+async def seed_images(main, client, mentor_ids, args, rng):
+    """몇 개의 이미지를 실제 업로드 경로로 올린 뒤 같은 해시를 다른 멘토들에게 나눠 붙임"""
+    from sqlalchemy import update
+
+    uploaders = mentor_ids[:args.images]
+    digests = []
+    for mentor_id in uploaders:
+        response = await client.put(
+            "/api/profile/image",
+            files={"image": ("profile.jpg", sample_jpeg(rng), "image/jpeg")},
+            headers=auth_headers(main, mentor_id, "mentor"),
+        )
+        response.raise_for_status()
+    async with main.SessionLocal() as db:
+        for mentor_id in uploaders:
+            digests.append((await db.get(main.User, mentor_id)).profile_image_hash)
+        # 나머지 멘토의 절반에 이미지 연결 (나머지 절반은 기본 아바타 경로)
+        rows = [
+            {"id": mentor_id, "profile_image_hash": digests[index % len(digests)]}
+            for index, mentor_id in enumerate(mentor_ids[len(uploaders):])
+            if index % 2 == 0
+        ]
+        if rows:
+            await db.execute(update(main.User), rows)
+        await db.commit()
+
+
+async def run_scenario(seconds, clients, next_call):
+    """clients 개 루프가 seconds 동안 next_call() 이 돌려주는 (엔드포인트, 요청 코루틴) 실행
+
+    next_call() 이 None 을 돌려주면 그 루프는 일찍 끝남 (처리할 요청이 바닥난 경우).
+    5xx 와 예외만 오류로 세고 나머지 상태 코드는 분포로 기록.
+    """
+    deadline = time.perf_counter() + seconds
+    latencies = {}
+    statuses = {}
+    errors = {}
+
+    async def loop():
+        while time.perf_counter() < deadline:
+            call = next_call()
+            if call is None:
+                return
+            endpoint, request = call
+            started = time.perf_counter()
+            try:
+                response = await request
+                code = str(response.status_code)
+            except Exception:
+                code = "exception"
+            latencies.setdefault(endpoint, []).append((time.perf_counter() - started) * 1000)
+            counts = statuses.setdefault(endpoint, {})
+            counts[code] = counts.get(code, 0) + 1
+            if code == "exception" or code.startswith("5"):
+                errors[endpoint] = errors.get(endpoint, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(loop() for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    return {
+        endpoint: {
+            "count": len(values),
+            "ops_per_s": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50), 2),
+            "p95_ms": round(percentile(values, 95), 2),
+            "p99_ms": round(percentile(values, 99), 2),
+            "errors": errors.get(endpoint, 0),
+            "status": dict(sorted(statuses[endpoint].items())),
+        }
+        for endpoint, values in sorted(latencies.items())
+    }
+
+
+def compare(report, baseline, threshold):
+    """기준 결과 대비 p95 가 threshold 배 이상 느려졌거나 처리량이 1/threshold 이하로 떨어진 항목"""
+    regressions = []
+    for scenario, endpoints in report["scenarios"].items():
+        for endpoint, current in endpoints.items():
+            previous = baseline.get("scenarios", {}).get(scenario, {}).get(endpoint)
+            if not previous:
+                continue
+            if previous["p95_ms"] and current["p95_ms"] > previous["p95_ms"] * threshold:
+                regressions.append(f"{scenario} {endpoint}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+            if previous["ops_per_s"] and current["ops_per_s"] * threshold < previous["ops_per_s"]:
+                regressions.append(f"{scenario} {endpoint}: {previous['ops_per_s']} -> {current['ops_per_s']} ops/s")
+    return regressions
+
+
+async def run(args):
+    # 모든 가상 클라이언트가 같은 IP 이므로 기본적으로 로그인 속도 제한을 끄고 bcrypt 풀 자체를 측정
+    env = {"RATE_LIMIT_ENABLED": "1" if args.rate_limits else "0"}
+    if args.bcrypt_rounds:
+        env["BCRYPT_ROUNDS"] = args.bcrypt_rounds
+    main, _ = import_main("mentor-load-", **env)
+
+    rng = random.Random(args.seed)
+    async with running_app(main, timeout=None) as client:
+        seeded = time.perf_counter()
+        mentor_ids, mentees, pending = await seed(main, args, rng)
+
+        if "images" in args.scenarios:
+            await seed_images(main, client, mentor_ids, args, rng)
+        seed_seconds = time.perf_counter() - seeded
+
+        mentee_headers = [auth_headers(main, mentee_id, "mentee") for mentee_id, _ in mentees[:args.clients]]
+        mentor_headers = {
+            mentor_id: auth_headers(main, mentor_id, "mentor") for mentor_id in mentor_ids[:args.contention_mentors]
+        }
+        rng.shuffle(pending)
+
+        def login_call():
+            _, email = rng.choice(mentees)
+            return "POST /api/login", client.post("/api/login", json={"email": email, "password": PASSWORD})
+
+        def mentors_call():
+            params = {"limit": rng.choice([10, 20, 50]), "order_by": rng.choice(["name", "skill"])}
+            if rng.random() < 0.7:
+                params["skill"] = rng.choice(SKILLS)
+            return "GET /api/mentors", client.get("/api/mentors", params=params, headers=rng.choice(mentee_headers))
+
+        def images_call():
+            headers = {"Accept": "image/webp,*/*"} if rng.random() < 0.5 else {}
+            params = {"size": rng.choice([64, 128, 256])}
+            return "GET /api/images/{role}/{id}", client.get(
+                f"/api/images/mentor/{rng.choice(mentor_ids)}", params=params, headers=headers
+            )
+
+        def contention_call():
+            if not pending:
+                return None
+            request_id, mentor_id = pending.pop()
+            action = rng.choice(["accept", "reject"])
+            return f"PUT /api/match-requests/{{id}}/{action}", client.put(
+                f"/api/match-requests/{request_id}/{action}", headers=mentor_headers[mentor_id]
+            )
+
+        calls = {
+            "login": login_call,
+            "mentors": mentors_call,
+            "images": images_call,
+            "contention": contention_call,
+        }
+        scenarios = {}
+        for scenario in args.scenarios:
+            scenarios[scenario] = await run_scenario(args.seconds, args.clients, calls[scenario])
+
+    report = {
+        "revision": git_revision(),
+        "config": {
+            "mentors": args.mentors,
+            "mentees": args.mentees,
+            "requests": args.requests,
+            "images": args.images,
+            "clients": args.clients,
+            "seconds": args.seconds,
+            "seed": args.seed,
+            "bcrypt_rounds": main.BCRYPT_ROUNDS,
+            "rate_limits": main.RATE_LIMIT_ENABLED,
+            "db_profile": main.DB_PROFILE,
+        },
+        "seed_s": round(seed_seconds, 2),
+        "scenarios": scenarios,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+def main():
+    parser = make_parser(__doc__, seed=42)
+    parser.add_argument("--mentors", type=int, default=2000, help="생성할 멘토 수")
+    parser.add_argument("--mentees", type=int, default=2000, help="생성할 멘티 수")
+    parser.add_argument("--requests", type=int, default=1000, help="경합 시나리오용 대기 요청 수 (멘티 수 이하)")
+    parser.add_argument("--contention-mentors", type=int, default=10, help="대기 요청을 나눠 받을 멘토 수")
+    parser.add_argument("--images", type=int, default=5, help="업로드할 서로 다른 프로필 이미지 수")
+    parser.add_argument("--clients", type=int, default=50, help="시나리오별 동시 클라이언트 수")
+    parser.add_argument("--seconds", type=float, default=5, help="시나리오별 최대 실행 시간(초)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS, help="실행할 시나리오")
+    parser.add_argument("--bcrypt-rounds", type=int, help="BCRYPT_ROUNDS 덮어쓰기 (기본값: 앱 설정)")
+    parser.add_argument("--rate-limits", action="store_true", help="로그인/회원가입 속도 제한 켜기 (기본값: 끔)")
+    parser.add_argument("--output", help="결과 JSON 을 저장할 파일")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=1.5, help="회귀로 판단할 배율")
+    args = parser.parse_args()
+    if args.requests > args.mentees:
+        parser.error("--requests 는 --mentees 이하여야 합니다 (멘티당 대기 요청 1개)")
+    if args.contention_mentors > args.mentors or args.images > args.mentors:
+        parser.error("--contention-mentors 와 --images 는 --mentors 이하여야 합니다")
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
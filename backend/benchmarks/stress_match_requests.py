@@ -0,0 +1,85 @@
+"""매칭 요청 동시성 스트레스 테스트 - 멘티당 대기 요청 1개, 멘토당 수락 요청 1개 불변식 검증
+
+사용법:
+    cd backend
+    python benchmarks/stress_match_requests.py --mentors 10 --mentees 40 --attempts 8
+
+멘티마다 여러 멘토에게 동시에 요청을 보내고, 멘토마다 받은 요청을 동시에 수락한 뒤
+DB 를 직접 조회해 두 불변식이 깨졌는지 확인합니다. 위반이 있으면 종료 코드 1.
+"""
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import sys
+from collections import Counter
+
+from common import auth_headers, import_main, make_parser, running_app, seed_users
+
+
+def check_invariants(db_path):
+    conn = sqlite3.connect(db_path)
+    pending = conn.execute(
+        "SELECT mentee_id, COUNT(*) FROM match_requests WHERE status = 'PENDING' GROUP BY mentee_id HAVING COUNT(*) > 1"
+    ).fetchall()
+    accepted = conn.execute(
+        "SELECT mentor_id, COUNT(*) FROM match_requests WHERE status = 'ACCEPTED' GROUP BY mentor_id HAVING COUNT(*) > 1"
+    ).fetchall()
+    conn.close()
+    return pending, accepted
+
+
+async def run(args):
+    main, workdir = import_main("mentor-stress-")
+    rng = random.Random(args.seed)
+    db_path = os.path.join(workdir, "mentor_mentee.db")
+    async with running_app(main, base_url="http://stress") as client:
+        mentor_ids, mentee_ids = await seed_users(main, "stress", args.mentors, args.mentees, seed=args.seed)
+
+        # 1단계: 멘티마다 여러 멘토에게 동시에 요청 생성
+        create_calls = [
+            client.post(
+                "/api/match-requests",
+                json={"mentorId": rng.choice(mentor_ids), "message": "stress"},
+                headers=auth_headers(main, mentee_id, "mentee"),
+            )
+            for mentee_id in mentee_ids
+            for _ in range(args.attempts)
+        ]
+        rng.shuffle(create_calls)
+        create_statuses = Counter(response.status_code for response in await asyncio.gather(*create_calls))
+
+        # 2단계: 멘토마다 받은 요청을 모두 동시에 수락 시도
+        conn = sqlite3.connect(db_path)
+        requests_by_mentor = conn.execute("SELECT mentor_id, id FROM match_requests").fetchall()
+        conn.close()
+        accept_calls = [
+            client.put(f"/api/match-requests/{request_id}/accept", headers=auth_headers(main, mentor_id, "mentor"))
+            for mentor_id, request_id in requests_by_mentor
+        ]
+        rng.shuffle(accept_calls)
+        accept_statuses = Counter(response.status_code for response in await asyncio.gather(*accept_calls))
+
+    pending_violations, accepted_violations = check_invariants(db_path)
+    report = {
+        "create_statuses": dict(create_statuses),
+        "accept_statuses": dict(accept_statuses),
+        "pending_per_mentee_violations": pending_violations,
+        "accepted_per_mentor_violations": accepted_violations,
+        "ok": not pending_violations and not accepted_violations,
+    }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return report["ok"]
+
+
+def main():
+    parser = make_parser(__doc__, seed=7)
+    parser.add_argument("--mentors", type=int, default=10, help="멘토 수")
+    parser.add_argument("--mentees", type=int, default=40, help="멘티 수")
+    parser.add_argument("--attempts", type=int, default=8, help="멘티당 동시 요청 수")
+    sys.exit(0 if asyncio.run(run(parser.parse_args())) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""백엔드 관리 명령
+
+사용법:
+    cd backend
+    python manage.py migrate
+    python manage.py backfill-image-variants
+    python manage.py seed --scale 100 --seed 42
+"""
+import argparse
+import asyncio
+import json
+
+import main
+
+
+async def migrate(args):
+    try:
+        applied = await main.run_migrations()
+    finally:
+        await main.engine.dispose()
+    print(json.dumps({"applied": applied, "schema_version": main.SCHEMA_VERSION}, ensure_ascii=False))
+
+
+async def backfill_image_variants(args):
+    await main.run_migrations()
+    try:
+        result = await main.backfill_image_variants()
+    finally:
+        main.image_executor.shutdown(wait=True)
+        await main.engine.dispose()
+    print(json.dumps(result, ensure_ascii=False))
+
+
+async def seed(args):
+    await main.run_migrations()
+    try:
+        async with main.SessionLocal() as db:
+            result = await main.reset_and_seed(db, args.scale, args.seed)
+    finally:
+        main.password_hasher.shutdown()
+        main.image_executor.shutdown(wait=True)
+        await main.engine.dispose()
+    print(json.dumps(result.get("synthetic", {"scale": 0}), ensure_ascii=False))
+
+
+def add_seed_arguments(parser):
+    parser.add_argument("--scale", type=int, default=1, help="scale x (멘토 1,000명 + 멘티 4,000명) 규모로 생성")
+    parser.add_argument("--seed", type=int, default=main.SYNTHETIC_DEFAULT_SEED, help="난수 시드 (같으면 같은 데이터)")
+
+
+COMMANDS = {
+    "migrate": (migrate, "아직 적용되지 않은 스키마 마이그레이션 적용 (배포 시 1회)", None),
+    "backfill-image-variants": (backfill_image_variants, "기존 프로필 이미지의 크기/WebP 변형 일괄 생성", None),
+    "seed": (seed, "데이터베이스를 초기화하고 샘플 + 대량 합성 데이터 생성", add_seed_arguments),
+}
+
+
+def run():
+    parser = argparse.ArgumentParser(description="멘토링 커넥트 백엔드 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (_, help_text, add_arguments) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(subparser)
+    args = parser.parse_args()
+    asyncio.run(COMMANDS[args.command][0](args))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,54 @@
+"""백엔드 테스트 공통 설정
+
+임시 디렉토리의 SQLite DB 로 앱을 띄우고 (마이그레이션 후 TestClient 로 startup/shutdown),
+테스트마다 /api/admin/reset-database 로 샘플 데이터를 다시 만듭니다.
+
+사용법:
+    cd backend
+    python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# main 은 import 시점에 환경 변수를 읽으므로 먼저 설정
+os.chdir(tempfile.mkdtemp(prefix="mentor-tests-"))
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+sys.path.insert(0, BACKEND_DIR)
+
+import main  # noqa: E402
+
+PASSWORD = "password123"
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    from fastapi.testclient import TestClient
+
+    async def migrate():
+        await main.run_migrations()
+        await main.engine.dispose()
+
+    asyncio.run(migrate())
+    with TestClient(main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def client(app_client):
+    response = app_client.post("/api/admin/reset-database")
+    assert response.status_code == 200, response.text
+    return app_client
+
+
+def login(client, email: str) -> dict:
+    """로그인해 Authorization 헤더 반환"""
+    response = client.post("/api/login", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['token']}"}
@@ -0,0 +1,44 @@
+import pytest
+
+import main
+from conftest import login
+
+
+def test_invalid_upload_returns_fixed_message(client):
+    mentee = login(client, "mentee@example.com")
+    response = client.put(
+        "/api/profile/image", files={"image": ("avatar.png", b"not an image", "image/png")}, headers=mentee
+    )
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid image data"}
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("", "jpeg"),
+    ("*/*", "jpeg"),
+    ("image/avif,image/webp,image/apng,image/*,*/*;q=0.8", "webp"),
+    ("image/webp;q=0, image/jpeg", "jpeg"),
+    ("image/webp; q=0.0", "jpeg"),
+    ("image/jpeg, image/webp;q=0.5", "jpeg"),
+    ("image/jpeg;q=0.5, image/webp;q=0.9", "webp"),
+    ("image/*;q=0.9, image/webp", "webp"),
+    ("image/webp;q=abc", "jpeg"),
+])
+def test_negotiate_image_format(accept, expected):
+    assert main.negotiate_image_format(accept) == expected
+
+
+def test_profile_image_of_unknown_user_is_404(client):
+    mentor_id = client.get("/api/me", headers=login(client, "mentor1@example.com")).json()["id"]
+    assert client.get(f"/api/images/mentor/{mentor_id}").status_code == 200
+    assert client.get(f"/api/images/mentee/{mentor_id}").status_code == 404
+    assert client.get(f"/api/images/admin/{mentor_id}").status_code == 404
+    assert client.get("/api/images/mentor/999999").status_code == 404
+
+
+def test_profile_image_respects_webp_quality(client):
+    mentor_id = client.get("/api/me", headers=login(client, "mentor1@example.com")).json()["id"]
+    response = client.get(f"/api/images/mentor/{mentor_id}", headers={"Accept": "image/webp;q=0, image/*"})
+    assert response.headers["content-type"] == "image/jpeg"
+    response = client.get(f"/api/images/mentor/{mentor_id}", headers={"Accept": "image/webp,image/*"})
+    assert response.headers["content-type"] == "image/webp"
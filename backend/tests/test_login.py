@@ -0,0 +1,17 @@
+from fastapi.security import HTTPAuthorizationCredentials
+
+import main
+
+
+def bearer(email):
+    token = main.create_access_token({"user_id": 1, "email": email, "name": "", "role": "mentee"})
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_only_token_for_same_account_gets_priority():
+    assert main.password_priority(bearer("mentee@example.com"), "mentee@example.com") == main.PRIORITY_AUTHENTICATED
+    # 직접 가입한 계정의 토큰으로 다른 계정 로그인을 시도해도 예약 자리를 쓰지 못함
+    assert main.password_priority(bearer("attacker@example.com"), "mentee@example.com") == main.PRIORITY_ANONYMOUS
+    assert main.password_priority(None, "mentee@example.com") == main.PRIORITY_ANONYMOUS
+    invalid = HTTPAuthorizationCredentials(scheme="Bearer", credentials="not-a-token")
+    assert main.password_priority(invalid, "mentee@example.com") == main.PRIORITY_ANONYMOUS
@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+from sqlalchemy import func, select
+
+import main
+from conftest import PASSWORD, login
+
+MENTEES = 6
+ATTEMPTS = 3
+
+
+def signup_mentees(client):
+    headers = []
+    for number in range(MENTEES):
+        email = f"concurrent{number}@example.com"
+        response = client.post(
+            "/api/signup", json={"email": email, "password": PASSWORD, "name": f"멘티{number}", "role": "mentee"}
+        )
+        assert response.status_code == 201, response.text
+        headers.append(login(client, email))
+    return headers
+
+
+def test_concurrent_creates_and_accepts_keep_invariants(client):
+    mentees = signup_mentees(client)
+    mentor = login(client, "mentor1@example.com")
+    mentor_id = client.get("/api/me", headers=mentor).json()["id"]
+
+    async def race():
+        # 앱과 같은 이벤트 루프에서 요청을 동시에 보내 DB 제약이 경합을 막는지 확인
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as api:
+            created = await asyncio.gather(*(
+                api.post("/api/match-requests", json={"mentorId": mentor_id, "message": "hi"}, headers=headers)
+                for headers in mentees for _ in range(ATTEMPTS)
+            ))
+            request_ids = [response.json()["id"] for response in created if response.status_code == 200]
+            accepted = await asyncio.gather(*(
+                api.put(f"/api/match-requests/{request_id}/accept", headers=mentor) for request_id in request_ids
+            ))
+        return created, accepted
+
+    created, accepted = client.portal.call(race)
+    assert sorted(response.status_code for response in created) == [200] * MENTEES + [400] * (MENTEES * (ATTEMPTS - 1))
+    assert sorted(response.status_code for response in accepted) == [200] + [400] * (MENTEES - 1)
+
+    async def counts(status, column):
+        async with main.SessionLocal() as db:
+            return (await db.execute(
+                select(func.count()).where(main.MatchRequest.status == status).group_by(column)
+            )).scalars().all()
+
+    # 멘토당 수락 1건 이하, 멘티당 대기 중 요청 1건 이하
+    assert client.portal.call(counts, main.RequestStatus.ACCEPTED, main.MatchRequest.mentor_id) == [1]
+    assert max(client.portal.call(counts, main.RequestStatus.PENDING, main.MatchRequest.mentee_id)) == 1
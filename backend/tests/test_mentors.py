@@ -0,0 +1,68 @@
+import pytest
+from sqlalchemy import event
+
+import main
+from conftest import login
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("rea", "reb"),
+    ("a\U0010ffff", "b"),
+    ("\U0010ffff\U0010ffff", None),
+])
+def test_skill_prefix_upper_bound(prefix, expected):
+    assert main.skill_prefix_upper_bound(prefix) == expected
+
+
+def test_skill_filter_with_max_code_point(client):
+    mentee = login(client, "mentee@example.com")
+    response = client.get("/api/mentors", params={"skill": "\U0010ffff"}, headers=mentee)
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = client.get("/api/mentors", params={"skill": "reac"}, headers=mentee)
+    assert response.status_code == 200
+    assert response.json()
+
+
+def test_skill_match_modes(client):
+    mentee = login(client, "mentee@example.com")
+    # 접두어 검색이 기본값, 스킬 중간의 문자열은 찾지 않음
+    assert client.get("/api/mentors", params={"skill": "act"}, headers=mentee).json() == []
+    assert client.get("/api/mentors", params={"skill": "reac", "skill_match": "exact"}, headers=mentee).json() == []
+    assert client.get("/api/mentors", params={"skill": "react", "skill_match": "exact"}, headers=mentee).json()
+
+    response = client.get("/api/mentors", params={"skill": "react", "skill_match": "substring"}, headers=mentee)
+    assert response.status_code == 422
+
+
+def test_mentor_list_revalidation_skips_database(client):
+    mentee = login(client, "mentee@example.com")
+    etag = client.get("/api/mentors", headers=mentee).headers["etag"]
+
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(main.engine.sync_engine, "before_cursor_execute", listener)
+    try:
+        response = client.get("/api/mentors", headers={**mentee, "If-None-Match": etag})
+        cached = client.get("/api/mentors", headers=mentee)
+    finally:
+        event.remove(main.engine.sync_engine, "before_cursor_execute", listener)
+    assert response.status_code == 304
+    assert cached.status_code == 200
+    assert statements == []
+
+    # 멘토 프로필이 바뀌면 무효화로 카탈로그 버전을 다시 읽어 새 ETag
+    mentor = login(client, "mentor1@example.com")
+    mentor_id = client.get("/api/me", headers=mentor).json()["id"]
+    client.put(
+        "/api/profile",
+        json={"id": mentor_id, "name": "새 이름", "role": "mentor", "bio": "", "skills": ["React"]},
+        headers=mentor,
+    )
+    response = client.get("/api/mentors", headers={**mentee, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert any(mentor["profile"]["name"] == "새 이름" for mentor in response.json())
@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+import main
+
+
+def test_duplicate_pending_requests_abort_migration(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    # 부분 유니크 인덱스가 생기기 전의 DB: 같은 멘티의 대기 중 요청이 2건
+    with engine.begin() as conn:
+        main.Base.metadata.create_all(conn)
+        conn.execute(text("DROP INDEX uq_match_requests_pending_mentee"))
+        conn.execute(text(
+            "INSERT INTO match_requests (id, mentor_id, mentee_id, message, status) VALUES "
+            "(1, 10, 3, 'a', 'PENDING'), (2, 11, 3, 'b', 'PENDING'), (3, 12, 4, 'c', 'PENDING')"
+        ))
+
+    with pytest.raises(RuntimeError, match=r"uq_match_requests_pending_mentee.*mentee_id=3 \(2 rows\)"):
+        with engine.begin() as conn:
+            main.apply_migrations(conn)
+    with engine.connect() as conn:
+        assert main.applied_schema_version(conn) == 0
+
+    # 중복을 정리하면 다시 실행해 끝까지 적용
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE match_requests SET status = 'CANCELLED' WHERE id = 1"))
+        main.apply_migrations(conn)
+    with engine.connect() as conn:
+        assert main.applied_schema_version(conn) == main.SCHEMA_VERSION
+        indexes = {index["name"] for index in main.inspect(conn).get_indexes("match_requests")}
+    assert "uq_match_requests_pending_mentee" in indexes
+    engine.dispose()
@@ -0,0 +1,81 @@
+import main
+from conftest import login
+
+
+def redeem(client, ticket):
+    async def consume():
+        async with main.SessionLocal() as db:
+            return await main.redeem_stream_ticket(ticket, db)
+
+    # 앱과 같은 이벤트 루프에서 실행 (스트림 자체는 끝나지 않으므로 입장권 소비만 확인)
+    return client.portal.call(consume)
+
+
+def test_stream_ticket_is_single_use(client):
+    mentee = login(client, "mentee@example.com")
+    mentee_id = client.get("/api/me", headers=mentee).json()["id"]
+
+    response = client.post("/api/notifications/stream-ticket", headers=mentee)
+    assert response.status_code == 200
+    ticket = response.json()["ticket"]
+
+    assert redeem(client, ticket) == mentee_id
+    assert redeem(client, ticket) is None
+    assert client.get("/api/notifications/stream", params={"ticket": ticket}).status_code == 401
+
+
+def test_expired_stream_ticket_is_rejected(client, monkeypatch):
+    mentee = login(client, "mentee@example.com")
+    monkeypatch.setattr(main, "STREAM_TICKET_TTL_SECONDS", -1)
+    ticket = client.post("/api/notifications/stream-ticket", headers=mentee).json()["ticket"]
+    assert redeem(client, ticket) is None
+
+
+def test_stream_rejects_jwt_in_query(client):
+    token = login(client, "mentee@example.com")["Authorization"].split()[1]
+    assert client.get("/api/notifications/stream", params={"access_token": token}).status_code == 401
+    assert client.post("/api/notifications/stream-ticket").status_code == 403
+
+
+def test_event_log_cursor_waits_for_late_ids(monkeypatch):
+    cursor = main.EventLogCursor(gap_timeout=10)
+    cursor.last_id = 10
+    assert cursor.observe(13)
+    assert cursor.missing.keys() == {11, 12}
+    assert cursor.observe(12)
+    assert not cursor.observe(12)
+    assert not cursor.observe(13)
+
+    # 롤백 등으로 끝내 채워지지 않는 id 는 시간이 지나면 포기
+    now = main.time.monotonic()
+    monkeypatch.setattr(main.time, "monotonic", lambda: now + 11)
+    cursor.condition(main.NotificationEventRecord.id)
+    assert cursor.missing == {}
+
+
+def test_database_bus_delivers_late_committed_event(client):
+    bus = main.DatabaseNotificationBus(poll_interval=1, retention_seconds=60, history_size=10)
+    delivered = []
+    bus.dispatch = lambda notification: delivered.append(notification.id)
+
+    async def insert(record_id):
+        async with main.SessionLocal() as db:
+            await db.execute(main.insert(main.NotificationEventRecord).values(
+                id=record_id, user_id=1, event="test", data="{}", published_at=main.time.time()
+            ))
+            await db.commit()
+
+    async def scenario():
+        await bus.start()
+        await bus.stop()
+        first = bus._cursor.last_id + 1
+        # 먼저 id 를 받은 트랜잭션이 나중에 커밋된 경우
+        await insert(first + 1)
+        await bus._dispatch_new()
+        await insert(first)
+        await bus._dispatch_new()
+        await bus._dispatch_new()
+        return first
+
+    first = client.portal.call(scenario)
+    assert delivered == [first + 1, first]
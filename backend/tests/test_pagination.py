@@ -0,0 +1,39 @@
+import base64
+import json
+
+import pytest
+
+from conftest import login
+
+
+def make_cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def test_cursor_round_trip(client):
+    mentee = login(client, "mentee@example.com")
+    first = client.get("/api/mentors", params={"order_by": "name", "limit": 1}, headers=mentee)
+    assert first.status_code == 200
+    cursor = first.headers["X-Next-Cursor"]
+    second = client.get("/api/mentors", params={"order_by": "name", "limit": 1, "cursor": cursor}, headers=mentee)
+    assert second.status_code == 200
+    assert second.json()[0]["id"] != first.json()[0]["id"]
+
+
+@pytest.mark.parametrize("order_by, payload", [
+    ("name", ["name", ["a"], 1]),
+    ("name", ["name", {"a": 1}, 1]),
+    ("skill", ["skill", 3, 1]),
+    ("name", ["name", "a", True]),
+    (None, ["id", "a", 1]),
+    (None, ["id", None, "1"]),
+    ("name", {"name": 1}),
+])
+def test_cursor_with_wrong_types_is_rejected(client, order_by, payload):
+    mentee = login(client, "mentee@example.com")
+    params = {"limit": 1, "cursor": make_cursor(payload)}
+    if order_by:
+        params["order_by"] = order_by
+    response = client.get("/api/mentors", params=params, headers=mentee)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
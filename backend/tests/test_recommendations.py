@@ -0,0 +1,70 @@
+import pytest
+
+import main
+from conftest import login
+
+
+def recommended_score(client, headers, mentor_id):
+    response = client.get("/api/mentors/recommended", params={"skills": "React,Python"}, headers=headers)
+    assert response.status_code == 200, response.text
+    return next(mentor["score"] for mentor in response.json() if mentor["id"] == mentor_id)
+
+
+def test_cancelling_accepted_request_restores_score(client):
+    mentee = login(client, "mentee@example.com")
+    mentor = login(client, "mentor1@example.com")
+    mentor_id = client.get("/api/me", headers=mentor).json()["id"]
+    original = recommended_score(client, mentee, mentor_id)
+
+    request_id = client.post(
+        "/api/match-requests", json={"mentorId": mentor_id, "message": "hi"}, headers=mentee
+    ).json()["id"]
+    assert client.put(f"/api/match-requests/{request_id}/accept", headers=mentor).status_code == 200
+    assert recommended_score(client, mentee, mentor_id) < original
+
+    assert client.delete(f"/api/match-requests/{request_id}", headers=mentee).status_code == 200
+    assert recommended_score(client, mentee, mentor_id) == original
+
+
+def test_rejecting_accepted_request_restores_score(client):
+    mentee = login(client, "mentee@example.com")
+    mentor = login(client, "mentor1@example.com")
+    mentor_id = client.get("/api/me", headers=mentor).json()["id"]
+    original = recommended_score(client, mentee, mentor_id)
+
+    request_id = client.post(
+        "/api/match-requests", json={"mentorId": mentor_id, "message": "hi"}, headers=mentee
+    ).json()["id"]
+    client.put(f"/api/match-requests/{request_id}/accept", headers=mentor)
+    assert client.put(f"/api/match-requests/{request_id}/reject", headers=mentor).status_code == 200
+    assert recommended_score(client, mentee, mentor_id) == original
+
+
+def test_sql_fallback_matches_matrix(client):
+    mentee = login(client, "mentee@example.com")
+    mentor = login(client, "mentor1@example.com")
+    mentor_id = client.get("/api/me", headers=mentor).json()["id"]
+    request_id = client.post(
+        "/api/match-requests", json={"mentorId": mentor_id, "message": "hi"}, headers=mentee
+    ).json()["id"]
+    client.put(f"/api/match-requests/{request_id}/accept", headers=mentor)
+
+    async def compare():
+        await main.mentor_recommender.ensure_loaded()
+        async with main.SessionLocal() as db:
+            for skills in (["React"], ["react", " Python "], ["Go", "Unknown"], ["Unknown"]):
+                expected = main.mentor_recommender.recommend(skills, 10)
+                actual = await main.recommend_mentors_sql(db, skills, 10)
+                assert [user_id for user_id, _ in actual] == [user_id for user_id, _ in expected]
+                assert [score for _, score in actual] == pytest.approx([score for _, score in expected])
+
+    client.portal.call(compare)
+
+
+def test_recommendations_are_served_while_matrix_loads(client):
+    mentee = login(client, "mentee@example.com")
+    main.mentor_recommender.clear()
+
+    response = client.get("/api/mentors/recommended", params={"skills": "React"}, headers=mentee)
+    assert response.status_code == 200
+    assert response.json()
@@ -0,0 +1,18 @@
+import main
+
+
+def test_signup_after_synthetic_seed(app_client):
+    """합성 데이터는 id 를 직접 넣으므로 그 뒤 가입이 id 충돌 없이 다음 id 를 받아야 함"""
+    response = app_client.post("/api/admin/reset-database", params={"scale": 1})
+    assert response.status_code == 200, response.text
+    assert response.json()["synthetic"]["users"] == 5000
+
+    response = app_client.post("/api/signup", json={
+        "email": "new-mentee@example.com", "password": "password123", "name": "새 멘티", "role": "mentee",
+    })
+    assert response.status_code == 201, response.text
+
+
+def test_reset_rejects_scale_above_limit(app_client):
+    response = app_client.post("/api/admin/reset-database", params={"scale": main.SYNTHETIC_MAX_SCALE + 1})
+    assert response.status_code == 422
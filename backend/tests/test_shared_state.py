@@ -0,0 +1,20 @@
+import pytest
+
+import main
+
+
+def test_multiple_workers_refuse_memory_backend(monkeypatch):
+    monkeypatch.setattr(main, "SERVER_WORKERS", 2)
+    monkeypatch.setattr(main, "NOTIFICATION_BACKEND", "memory")
+    monkeypatch.setattr(main, "CACHE_INVALIDATION_BACKEND", "database")
+    with pytest.raises(RuntimeError, match="NOTIFICATION_BACKEND"):
+        main.check_shared_state_backend()
+
+    monkeypatch.setattr(main, "NOTIFICATION_BACKEND", "database")
+    main.check_shared_state_backend()
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setattr(main, "CACHE_INVALIDATION_BACKEND", "redis")
+    with pytest.raises(RuntimeError, match="memory, database"):
+        main.check_shared_state_backend()
@@ -0,0 +1,31 @@
+import json
+import os
+import subprocess
+import sys
+
+from conftest import BACKEND_DIR
+
+# 첫 이미지/로그인/추천 요청 때 import 되어야 하는 모듈 (benchmarks/check_startup.py 와 같은 목록)
+LAZY_MODULES = ["PIL", "numpy", "passlib", "jose"]
+
+
+def run_import(tmp_path, code, **env):
+    """새 인터프리터에서 main 을 import 하고 code 를 실행 (이 프로세스는 이미 여러 모듈을 불러왔으므로)"""
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path.insert(0, {BACKEND_DIR!r}); import main; {code}"],
+        cwd=tmp_path, capture_output=True, text=True, env={**os.environ, **env},
+    )
+
+
+def test_import_does_not_load_lazy_modules(tmp_path):
+    result = run_import(
+        tmp_path, f"import json; main.create_app(); print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+    )
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
+
+
+def test_unknown_db_profile_is_a_configuration_error(tmp_path):
+    result = run_import(tmp_path, "", DB_PROFILE="fast")
+    assert result.returncode != 0
+    assert "Unknown DB_PROFILE 'fast'; expected one of: production, default" in result.stderr
@@ -1,34 +1,22 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useCallback } from 'react';
 import { useAuth } from '../contexts/AuthContext';
-import { mentorService, authService } from '../services/api';
-import { User } from '../types';
+import { mentorService, authService, profileImageSrc } from '../services/api';
+import { useCursorList } from '../hooks/useCursorList';
 import './Auth.css';
 
 const Mentors: React.FC = () => {
   const { user } = useAuth();
-  const [mentors, setMentors] = useState<User[]>([]);
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState('');
   const [searchSkill, setSearchSkill] = useState('');
   const [orderBy, setOrderBy] = useState('');
   const [requestMessages, setRequestMessages] = useState<{[key: number]: string}>({});
   const [requestLoading, setRequestLoading] = useState<{[key: number]: boolean}>({});
 
-  useEffect(() => {
-    loadMentors();
-  }, [searchSkill, orderBy]); // eslint-disable-line react-hooks/exhaustive-deps
-
-  const loadMentors = async () => {
-    try {
-      setLoading(true);
-      const data = await mentorService.getMentors(searchSkill || undefined, orderBy || undefined);
-      setMentors(data);
-    } catch (err: any) {
-      setError('멘토 목록을 불러오는데 실패했습니다.');
-    } finally {
-      setLoading(false);
-    }
-  };
+  // 검색 조건이 바뀌면 첫 페이지부터 다시 조회하고, 스크롤하면 다음 페이지를 이어 붙임
+  const fetchMentors = useCallback(
+    (cursor: string | null) => mentorService.getMentorsPage(searchSkill || undefined, orderBy || undefined, cursor),
+    [searchSkill, orderBy]
+  );
+  const { items: mentors, nextCursor, loading, error, loadMore, sentinelRef } = useCursorList(fetchMentors);
 
   const handleMessageChange = (mentorId: number, message: string) => {
     setRequestMessages(prev => ({
@@ -100,20 +88,13 @@ const Mentors: React.FC = () => {
         </select>
       </div>
 
-      {loading && (
-        <div className="loading-container">
-          <div className="loading-spinner"></div>
-          <p>멘토 목록을 불러오는 중...</p>
-        </div>
-      )}
-      
-      {error && <div className="error-message">{error}</div>}
+      {error && <div className="error-message">멘토 목록을 불러오는데 실패했습니다.</div>}
 
       <div className="mentors-grid">
         {mentors.map((mentor) => (
           <div key={mentor.id} className="mentor">
             <img
-              src={`http://localhost:8080${mentor.profile.imageUrl}`}
+              src={profileImageSrc(mentor.profile.imageUrl, 160)}
               alt={mentor.profile.name}
               className="mentor-image"
               onError={(e) => {
@@ -156,7 +137,20 @@ const Mentors: React.FC = () => {
         ))}
       </div>
 
-      {!loading && mentors.length === 0 && (
+      {loading && (
+        <div className="loading-container">
+          <div className="loading-spinner"></div>
+          <p>멘토 목록을 불러오는 중...</p>
+        </div>
+      )}
+
+      {nextCursor && !loading && (
+        <div ref={sentinelRef} style={{ textAlign: 'center', marginTop: '2rem' }}>
+          <button className="btn-secondary" onClick={loadMore}>더 보기</button>
+        </div>
+      )}
+
+      {!loading && !error && mentors.length === 0 && (
         <div className="empty-state">
           <h3>🔍 조건에 맞는 멘토가 없습니다</h3>
           <p>다른 검색 조건을 시도해보세요.</p>
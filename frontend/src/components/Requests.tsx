@@ -1,47 +1,41 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useCallback } from 'react';
 import { useAuth } from '../contexts/AuthContext';
-import { authService } from '../services/api';
-import { MatchingRequest } from '../types';
+import { authService, matchRequestService, profileImageSrc } from '../services/api';
+import { useCursorList } from '../hooks/useCursorList';
+import { MatchingRequest, Page, UserProfile } from '../types';
 import './Auth.css';
 
 const Requests: React.FC = () => {
   const { user } = useAuth();
-  const [incomingRequests, setIncomingRequests] = useState<MatchingRequest[]>([]);
-  const [outgoingRequests, setOutgoingRequests] = useState<MatchingRequest[]>([]);
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState('');
+  const [actionError, setActionError] = useState('');
   const [actionLoading, setActionLoading] = useState<{ [key: number]: boolean }>({});
 
-  const loadRequests = async () => {
-    if (!user) return;
-    
-    try {
-      setLoading(true);
-      if (user.role === 'mentor') {
-        const requests = await authService.getIncomingRequests();
-        setIncomingRequests(requests);
-      } else {
-        const requests = await authService.getOutgoingRequests();
-        setOutgoingRequests(requests);
-      }
-    } catch (err: any) {
-      setError(err.response?.data?.detail || '요청을 불러오는데 실패했습니다.');
-    } finally {
-      setLoading(false);
-    }
-  };
+  // 멘토는 받은 요청, 멘티는 보낸 요청을 페이지 단위로 조회 (스크롤하면 다음 페이지를 이어 붙임)
+  const fetchRequests = useCallback((cursor: string | null): Promise<Page<MatchingRequest>> => {
+    if (!user) return Promise.resolve({ items: [], nextCursor: null });
+    return user.role === 'mentor'
+      ? matchRequestService.getIncomingRequestsPage(cursor)
+      : matchRequestService.getOutgoingRequestsPage(cursor);
+  }, [user]);
+  const { items: requests, nextCursor, loading, error: loadError, refresh, loadMore, sentinelRef } = useCursorList(fetchRequests);
+  const error = actionError || (loadError && (loadError.response?.data?.detail || '요청을 불러오는데 실패했습니다.'));
+  const countLabel = `${requests.length}${nextCursor ? '+' : ''}`;
 
+  // 요청 생성/수락/거절/취소 알림을 받으면 목록 갱신 (폴링 없음, 이미 불러온 페이지 수만큼 다시 조회)
   useEffect(() => {
-    loadRequests();
-  }, [user]); // eslint-disable-line react-hooks/exhaustive-deps
+    if (!user) return;
+    return matchRequestService.subscribe(() => {
+      refresh();
+    });
+  }, [user, refresh]);
 
   const handleAccept = async (requestId: number) => {
     try {
       setActionLoading(prev => ({ ...prev, [requestId]: true }));
       await authService.acceptRequest(requestId);
-      await loadRequests();
+      await refresh();
     } catch (err: any) {
-      setError(err.response?.data?.detail || '요청 수락에 실패했습니다.');
+      setActionError(err.response?.data?.detail || '요청 수락에 실패했습니다.');
     } finally {
       setActionLoading(prev => ({ ...prev, [requestId]: false }));
     }
@@ -51,9 +45,9 @@ const Requests: React.FC = () => {
     try {
       setActionLoading(prev => ({ ...prev, [requestId]: true }));
       await authService.rejectRequest(requestId);
-      await loadRequests();
+      await refresh();
     } catch (err: any) {
-      setError(err.response?.data?.detail || '요청 거절에 실패했습니다.');
+      setActionError(err.response?.data?.detail || '요청 거절에 실패했습니다.');
     } finally {
       setActionLoading(prev => ({ ...prev, [requestId]: false }));
     }
@@ -63,9 +57,9 @@ const Requests: React.FC = () => {
     try {
       setActionLoading(prev => ({ ...prev, [requestId]: true }));
       await authService.cancelRequest(requestId);
-      await loadRequests();
+      await refresh();
     } catch (err: any) {
-      setError(err.response?.data?.detail || '요청 취소에 실패했습니다.');
+      setActionError(err.response?.data?.detail || '요청 취소에 실패했습니다.');
     } finally {
       setActionLoading(prev => ({ ...prev, [requestId]: false }));
     }
@@ -101,6 +95,30 @@ const Requests: React.FC = () => {
     }
   };
 
+  // 목록 응답에 포함된 상대방 프로필 (추가 요청 없이 표시)
+  const renderCounterpart = (profile: UserProfile) => (
+    <div style={{ display: 'flex', alignItems: 'center', gap: '0.75rem', marginBottom: '0.5rem' }}>
+      <img
+        src={profileImageSrc(profile.imageUrl, 64)}
+        alt={profile.name}
+        style={{ width: '48px', height: '48px', borderRadius: '50%', objectFit: 'cover' }}
+      />
+      <div>
+        <div style={{ fontWeight: 600 }}>{profile.name}</div>
+        {profile.bio && <div style={{ color: 'var(--text-secondary)', fontSize: '0.9rem' }}>{profile.bio}</div>}
+        {profile.skills && profile.skills.length > 0 && (
+          <div className="skills-list">
+            {profile.skills.map((skill, index) => (
+              <span key={index} className="skill-tag">
+                {skill}
+              </span>
+            ))}
+          </div>
+        )}
+      </div>
+    </div>
+  );
+
   if (!user) {
     return <div>로딩 중...</div>;
   }
@@ -116,21 +134,21 @@ const Requests: React.FC = () => {
         </p>
       </div>
 
-      {loading && <div style={{ textAlign: 'center' }}>로딩 중...</div>}
       {error && <div className="error-message">{error}</div>}
 
       {user.role === 'mentor' && (
         <div>
           <h2 style={{ color: 'var(--text-primary)', marginBottom: '1rem' }}>
-            📨 받은 요청 ({incomingRequests.length})
+            📨 받은 요청 ({countLabel})
           </h2>
           <div className="requests-list">
-            {incomingRequests.length === 0 ? (
+            {requests.length === 0 ? (
               <p>받은 요청이 없습니다.</p>
             ) : (
-              incomingRequests.map((request) => (
+              requests.map((request) => (
                 <div key={request.id} className="request-card">
                   <div className="request-message" {...({ mentee: request.menteeId.toString() } as any)}>
+                    {request.counterpart && renderCounterpart(request.counterpart)}
                     <strong>멘티 ID: {request.menteeId}</strong>
                     <p>{request.message}</p>
                   </div>
@@ -167,15 +185,16 @@ const Requests: React.FC = () => {
       {user.role === 'mentee' && (
         <div>
           <h2 style={{ color: 'var(--text-primary)', marginBottom: '1rem' }}>
-            📤 보낸 요청 ({outgoingRequests.length})
+            📤 보낸 요청 ({countLabel})
           </h2>
           <div className="requests-list">
-            {outgoingRequests.length === 0 ? (
+            {requests.length === 0 ? (
               <p>보낸 요청이 없습니다.</p>
             ) : (
-              outgoingRequests.map((request) => (
+              requests.map((request) => (
                 <div key={request.id} className="request-card">
                   <div>
+                    {request.counterpart && renderCounterpart(request.counterpart)}
                     <strong>멘토 ID: {request.mentorId}</strong>
                     <p>{request.message}</p>
                   </div>
@@ -199,6 +218,13 @@ const Requests: React.FC = () => {
           </div>
         </div>
       )}
+
+      {loading && <div style={{ textAlign: 'center' }}>로딩 중...</div>}
+      {nextCursor && !loading && (
+        <div ref={sentinelRef} style={{ textAlign: 'center', marginTop: '1rem' }}>
+          <button className="btn-secondary" onClick={loadMore}>더 보기</button>
+        </div>
+      )}
     </div>
   );
 };
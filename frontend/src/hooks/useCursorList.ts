@@ -0,0 +1,91 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+import { Page } from '../types';
+
+// 커서 페이지네이션 목록 (무한 스크롤)
+// fetchPage 가 바뀌면(검색 조건/사용자 변경) 첫 페이지부터 다시 불러오고,
+// sentinelRef 를 붙인 요소가 화면에 들어오면 다음 페이지를 이어 붙임
+export function useCursorList<T>(fetchPage: (cursor: string | null) => Promise<Page<T>>) {
+  const [items, setItems] = useState<T[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<any>(null);
+  // 조건이 바뀐 뒤 도착한 이전 요청의 응답은 버림
+  const generation = useRef(0);
+  const busy = useRef(false);
+  const itemsRef = useRef<T[]>([]);
+  const cursorRef = useRef<string | null>(null);
+  itemsRef.current = items;
+  cursorRef.current = nextCursor;
+
+  // 첫 페이지부터 count 개 이상이 될 때까지 다시 불러옴
+  const reload = useCallback(async (count: number = 0) => {
+    const current = ++generation.current;
+    busy.current = true;
+    setLoading(true);
+    try {
+      let loaded: T[] = [];
+      let cursor: string | null = null;
+      do {
+        const page: Page<T> = await fetchPage(cursor);
+        if (current !== generation.current) return;
+        loaded = loaded.concat(page.items);
+        cursor = page.nextCursor;
+      } while (cursor && loaded.length < count);
+      setItems(loaded);
+      setNextCursor(cursor);
+      setError(null);
+    } catch (err) {
+      if (current === generation.current) setError(err);
+    } finally {
+      if (current === generation.current) {
+        busy.current = false;
+        setLoading(false);
+      }
+    }
+  }, [fetchPage]);
+
+  // 알림/상태 변경 후 갱신 - 이미 스크롤해서 불러온 만큼은 유지
+  const refresh = useCallback(() => reload(itemsRef.current.length), [reload]);
+
+  const loadMore = useCallback(async () => {
+    const cursor = cursorRef.current;
+    if (!cursor || busy.current) return;
+    const current = generation.current;
+    busy.current = true;
+    setLoading(true);
+    try {
+      const page = await fetchPage(cursor);
+      if (current !== generation.current) return;
+      setItems(prev => prev.concat(page.items));
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      if (current === generation.current) setError(err);
+    } finally {
+      if (current === generation.current) {
+        busy.current = false;
+        setLoading(false);
+      }
+    }
+  }, [fetchPage]);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  // 센티널은 다음 페이지가 있고 로딩 중이 아닐 때만 렌더링되므로,
+  // 페이지가 짧아 계속 보이는 경우에도 다시 붙을 때마다 관찰 콜백이 호출되어 이어서 불러옴
+  const loadMoreRef = useRef(loadMore);
+  loadMoreRef.current = loadMore;
+  const observer = useRef<IntersectionObserver | null>(null);
+  const sentinelRef = useCallback((node: HTMLElement | null) => {
+    observer.current?.disconnect();
+    observer.current = null;
+    if (!node || typeof IntersectionObserver === 'undefined') return;
+    observer.current = new IntersectionObserver((entries) => {
+      if (entries.some(entry => entry.isIntersecting)) loadMoreRef.current();
+    }, { rootMargin: '200px' });
+    observer.current.observe(node);
+  }, []);
+
+  return { items, nextCursor, loading, error, refresh, loadMore, sentinelRef };
+}
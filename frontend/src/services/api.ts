@@ -1,7 +1,13 @@
-import axios from 'axios';
-import { User, SignupRequest, LoginRequest, LoginResponse, ProfileUpdateRequest, MatchRequest, MatchRequestCreate } from '../types';
+import axios, { AxiosResponse } from 'axios';
+import { User, SignupRequest, LoginRequest, LoginResponse, ProfileUpdateRequest, MatchRequest, MatchRequestCreate, Page } from '../types';
 
 const API_BASE_URL = 'http://localhost:8080/api';
+const NEXT_CURSOR_HEADER = 'x-next-cursor';
+const DEFAULT_PAGE_LIMIT = 20;
+// 서버 알림 스트림(SSE) 이벤트 이름
+const NOTIFICATION_EVENTS = ['match_request.created', 'match_request.updated'];
+// 알림 스트림이 끊겼을 때 새 입장권으로 다시 연결하기까지 대기 시간 (서버의 SSE retry 값과 같음)
+const NOTIFICATION_RETRY_MS = 3000;
 
 const api = axios.create({
   baseURL: API_BASE_URL,
@@ -19,6 +25,29 @@ api.interceptors.request.use((config) => {
   return config;
 });
 
+// 프로필 이미지 URL - size 를 주면 그 이상인 가장 작은 변형(64/128/256/500px)을 받음
+export const profileImageSrc = (imageUrl: string, size?: number): string => {
+  const url = `http://localhost:8080${imageUrl}`;
+  if (!size) return url;
+  return `${url}${url.includes('?') ? '&' : '?'}size=${size}`;
+};
+
+// 다음 페이지 커서는 응답 헤더로 전달됨 (마지막 페이지면 null)
+const toPage = <T>(response: AxiosResponse<T[]>): Page<T> => {
+  const nextCursor = response.headers[NEXT_CURSOR_HEADER];
+  return {
+    items: response.data,
+    nextCursor: typeof nextCursor === 'string' ? nextCursor : null,
+  };
+};
+
+const pageParams = (cursor?: string | null, limit: number = DEFAULT_PAGE_LIMIT): URLSearchParams => {
+  const params = new URLSearchParams();
+  params.append('limit', String(limit));
+  if (cursor) params.append('cursor', cursor);
+  return params;
+};
+
 export const authService = {
   async signup(data: SignupRequest): Promise<void> {
     await api.post('/signup', data);
@@ -39,17 +68,17 @@ export const authService = {
     return response.data;
   },
 
-  // 매칭 요청 관련 메서드들
-  async getIncomingRequests(): Promise<MatchRequest[]> {
-    const response = await api.get<MatchRequest[]>('/match-requests/incoming');
-    return response.data;
-  },
-
-  async getOutgoingRequests(): Promise<MatchRequest[]> {
-    const response = await api.get<MatchRequest[]>('/match-requests/outgoing');
+  // 프로필 이미지 업로드 (multipart, base64 인코딩 없이 파일 그대로 전송)
+  async uploadProfileImage(file: File): Promise<User> {
+    const formData = new FormData();
+    formData.append('image', file);
+    const response = await api.put<User>('/profile/image', formData, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
     return response.data;
   },
 
+  // 매칭 요청 관련 메서드들
   async acceptRequest(id: number): Promise<MatchRequest> {
     const response = await api.put<MatchRequest>(`/match-requests/${id}/accept`);
     return response.data;
@@ -73,13 +102,14 @@ export const authService = {
 };
 
 export const mentorService = {
-  async getMentors(skill?: string, orderBy?: string): Promise<User[]> {
-    const params = new URLSearchParams();
+  // 무한 스크롤: 이전 페이지의 nextCursor 를 넘겨 다음 페이지 조회
+  async getMentorsPage(skill?: string, orderBy?: string, cursor?: string | null, limit?: number): Promise<Page<User>> {
+    const params = pageParams(cursor, limit);
     if (skill) params.append('skill', skill);
     if (orderBy) params.append('order_by', orderBy);
-    
+
     const response = await api.get<User[]>(`/mentors?${params.toString()}`);
-    return response.data;
+    return toPage(response);
   },
 };
 
@@ -89,14 +119,14 @@ export const matchRequestService = {
     return response.data;
   },
 
-  async getIncomingRequests(): Promise<MatchRequest[]> {
-    const response = await api.get<MatchRequest[]>('/match-requests/incoming');
-    return response.data;
+  async getIncomingRequestsPage(cursor?: string | null, limit?: number): Promise<Page<MatchRequest>> {
+    const response = await api.get<MatchRequest[]>(`/match-requests/incoming?${pageParams(cursor, limit).toString()}&expand=counterpart`);
+    return toPage(response);
   },
 
-  async getOutgoingRequests(): Promise<MatchRequest[]> {
-    const response = await api.get<MatchRequest[]>('/match-requests/outgoing');
-    return response.data;
+  async getOutgoingRequestsPage(cursor?: string | null, limit?: number): Promise<Page<MatchRequest>> {
+    const response = await api.get<MatchRequest[]>(`/match-requests/outgoing?${pageParams(cursor, limit).toString()}&expand=counterpart`);
+    return toPage(response);
   },
 
   async acceptRequest(id: number): Promise<MatchRequest> {
@@ -113,6 +143,52 @@ export const matchRequestService = {
     const response = await api.delete<MatchRequest>(`/match-requests/${id}`);
     return response.data;
   },
+
+  // 매칭 요청 생성/상태 변경 알림 구독 (반환값을 호출하면 구독 해제)
+  // EventSource 는 헤더를 보낼 수 없어 JWT 대신 1회용 입장권을 쿼리로 전달 (URL 이 로그에 남아도 재사용 불가)
+  // 입장권은 한 번만 쓸 수 있으므로 브라우저 자동 재연결 대신, 끊기면 새 입장권을 받아 마지막 이벤트 id 부터 이어받음
+  subscribe(onChange: (request: MatchRequest) => void): () => void {
+    let source: EventSource | null = null;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let lastEventId = '';
+    let closed = false;
+
+    const listener = (event: Event) => {
+      const message = event as MessageEvent;
+      if (message.lastEventId) lastEventId = message.lastEventId;
+      onChange(JSON.parse(message.data));
+    };
+
+    const reconnect = () => {
+      if (!closed) retryTimer = setTimeout(connect, NOTIFICATION_RETRY_MS);
+    };
+
+    const connect = async () => {
+      try {
+        const response = await api.post<{ ticket: string }>('/notifications/stream-ticket');
+        if (closed) return;
+        const params = new URLSearchParams({ ticket: response.data.ticket });
+        if (lastEventId) params.append('last_event_id', lastEventId);
+        const current = new EventSource(`${API_BASE_URL}/notifications/stream?${params.toString()}`);
+        NOTIFICATION_EVENTS.forEach((name) => current.addEventListener(name, listener));
+        current.onerror = () => {
+          current.close();
+          source = null;
+          reconnect();
+        };
+        source = current;
+      } catch {
+        reconnect();
+      }
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      source?.close();
+    };
+  },
 };
 
 export default api;
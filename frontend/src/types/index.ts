@@ -43,11 +43,19 @@ export interface MatchRequest {
   menteeId: number;
   message: string;
   status: 'pending' | 'accepted' | 'rejected' | 'cancelled';
+  // expand=counterpart 로 조회한 경우 상대방 프로필 (받은 요청은 멘티, 보낸 요청은 멘토)
+  counterpart?: UserProfile | null;
 }
 
 // 별칭 추가
 export type MatchingRequest = MatchRequest;
 
+// 커서 기반 페이지 (무한 스크롤용)
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
 export interface MatchRequestCreate {
   mentorId: number;
   menteeId: number;